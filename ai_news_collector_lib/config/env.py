@@ -0,0 +1,29 @@
+"""
+环境变量加载
+同一进程只解析一次 .env 文件
+"""
+
+import os
+
+from dotenv import load_dotenv
+
+# 设置该环境变量可完全跳过 .env 加载（由应用自行管理环境变量）
+DOTENV_SKIP_FLAG = "AI_NEWS_SKIP_DOTENV"
+
+# 本进程是否已加载过 .env；只保存在模块内，子进程（可能在其他工作目录）仍会加载自己的 .env
+_dotenv_loaded = False
+
+
+def load_env_once() -> bool:
+    """
+    加载 .env 文件中的环境变量（只加载一次）
+
+    Returns:
+        bool: 本次调用是否实际读取了 .env
+    """
+    global _dotenv_loaded
+    if _dotenv_loaded or os.environ.get(DOTENV_SKIP_FLAG):
+        return False
+    load_dotenv()
+    _dotenv_loaded = True
+    return True
@@ -3,14 +3,16 @@
 支持单个搜索引擎的独立配置和时间范围设置
 """
 
-from dataclasses import dataclass, field
-from typing import Optional, Dict, Any, List
+from dataclasses import InitVar, dataclass, field, fields
+from typing import Optional, Dict, Any, List, Iterable, FrozenSet
 from enum import Enum
 import os
-from dotenv import load_dotenv
+import sys
 
-# 加载环境变量
-load_dotenv()
+from .env import load_env_once
+
+# 加载环境变量（.env 只解析一次）
+load_env_once()
 
 
 class TimeRange(Enum):
@@ -22,7 +24,46 @@ class TimeRange(Enum):
     CUSTOM = "custom"
 
 
-@dataclass
+# 预设时间范围对应的天数（CUSTOM 不在表中，回退到 custom_days/days_back）
+_DAYS_BY_RANGE = {
+    TimeRange.ONE_DAY: 1,
+    TimeRange.ONE_WEEK: 7,
+    TimeRange.ONE_MONTH: 30,
+    TimeRange.ONE_YEAR: 365,
+}
+
+# Python 3.10+ 使用 __slots__ 生成 dataclass（去掉实例 __dict__，属性访问更快）；
+# 更早版本的 dataclass 不支持 slots 参数，且字段默认值与手写 __slots__ 冲突，保持普通 dataclass
+_DATACLASS_OPTIONS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# 默认搜索引擎及其默认启用状态：免费搜索引擎启用，付费搜索引擎默认禁用
+_DEFAULT_ENGINES = (
+    ("hackernews", True),
+    ("arxiv", True),
+    ("duckduckgo", True),
+    ("rss_feeds", True),
+    ("newsapi", False),
+    ("tavily", False),
+    ("google_search", False),
+    ("bing_search", False),
+    ("serper", False),
+    ("brave_search", False),
+    ("metasota_search", False),
+)
+
+# 搜索引擎名称 -> API 密钥环境变量
+_API_KEY_MAPPING = {
+    "newsapi": "NEWS_API_KEY",
+    "tavily": "TAVILY_API_KEY",
+    "google_search": "GOOGLE_SEARCH_API_KEY",
+    "bing_search": "BING_SEARCH_API_KEY",
+    "serper": "SERPER_API_KEY",
+    "brave_search": "BRAVE_SEARCH_API_KEY",
+    "metasota_search": "METASOSEARCH_API_KEY",
+}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class EngineConfig:
     """单个搜索引擎的配置"""
     
@@ -40,22 +81,32 @@ class EngineConfig:
     api_key: Optional[str] = None
     
     def get_effective_days_back(self) -> int:
-        """获取有效的时间范围天数"""
+        """获取有效的时间范围天数（每次按当前字段计算，直接修改字段后也不会过期）"""
         if self.time_range == TimeRange.CUSTOM and self.custom_days is not None:
             return self.custom_days
-        elif self.time_range == TimeRange.ONE_DAY:
-            return 1
-        elif self.time_range == TimeRange.ONE_WEEK:
-            return 7
-        elif self.time_range == TimeRange.ONE_MONTH:
-            return 30
-        elif self.time_range == TimeRange.ONE_YEAR:
-            return 365
-        else:
-            return self.days_back
+        return _DAYS_BY_RANGE.get(self.time_range, self.days_back)
 
+    @classmethod
+    def _fast_default(cls, enabled: bool = True) -> "EngineConfig":
+        """快速创建默认配置：跳过 dataclass 生成的 __init__，直接复制默认属性"""
+        obj = cls.__new__(cls)
+        for name, value in _DEFAULT_ENGINE_ITEMS:
+            object.__setattr__(obj, name, value)
+        obj.enabled = enabled
+        return obj
 
-@dataclass
+
+# 默认 EngineConfig 的属性，供 _fast_default 复制；
+# 使用 dataclass 字段而非 __dict__，兼容 __slots__
+def _default_engine_items() -> tuple:
+    prototype = EngineConfig()
+    return tuple((f.name, getattr(prototype, f.name)) for f in fields(EngineConfig))
+
+
+_DEFAULT_ENGINE_ITEMS = _default_engine_items()
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class FlexibleSearchConfig:
     """灵活的搜索配置"""
     
@@ -66,6 +117,11 @@ class FlexibleSearchConfig:
     global_similarity_threshold: float = 0.85
     global_max_articles: int = 10
     global_days_back: int = 7
+    # Google 自定义搜索引擎ID（google_search 需要）
+    google_search_engine_id: Optional[str] = None
+    
+    # 同时执行的搜索引擎数上限（每个引擎占用一个线程池线程）
+    max_concurrent_engines: int = 8
     
     # 高级功能
     enable_content_extraction: bool = False
@@ -81,56 +137,55 @@ class FlexibleSearchConfig:
     llm_api_key: Optional[str] = None
     query_enhancement_cache_ttl: int = 24 * 60 * 60
     
-    def __post_init__(self):
+    # 仅供 for_engines() 使用：只启用这些默认搜索引擎
+    _selected_engines: InitVar[Optional[FrozenSet[str]]] = None
+    
+    def __post_init__(self, _selected_engines: Optional[FrozenSet[str]] = None):
         """初始化后处理"""
         # 从环境变量加载LLM API密钥
         if not self.llm_api_key:
-            self.llm_api_key = os.getenv("GOOGLE_API_KEY")
+            self.llm_api_key = os.environ.get("GOOGLE_API_KEY")
         
         # 初始化默认搜索引擎配置
-        self._initialize_default_engines()
+        self._initialize_default_engines(_selected_engines)
         
         # 从环境变量加载API密钥
-        self._load_api_keys_from_env()
+        self._load_api_keys_from_env(auto_enable=_selected_engines is None)
+    
+    @classmethod
+    def for_engines(cls, engines: Iterable[str], **kwargs) -> "FlexibleSearchConfig":
+        """
+        创建只启用指定搜索引擎的配置
+        
+        其余默认搜索引擎仍会创建（保留环境变量中的API密钥）但保持禁用，
+        不会因为存在API密钥而被自动启用。
+        
+        Args:
+            engines: 要启用的搜索引擎名称
+            **kwargs: 其他 FlexibleSearchConfig 字段
+        """
+        return cls(_selected_engines=frozenset(engines), **kwargs)
     
-    def _initialize_default_engines(self):
-        """初始化默认搜索引擎配置"""
+    def _initialize_default_engines(self, selected: Optional[FrozenSet[str]] = None):
+        """初始化默认搜索引擎配置，selected 不为 None 时只启用其中的搜索引擎"""
         if not self.engines:
-            # 免费搜索引擎
-            self.engines["hackernews"] = EngineConfig(enabled=True)
-            self.engines["arxiv"] = EngineConfig(enabled=True)
-            self.engines["duckduckgo"] = EngineConfig(enabled=True)
-            self.engines["rss_feeds"] = EngineConfig(enabled=True)
-            
-            # 付费搜索引擎（默认禁用）
-            self.engines["newsapi"] = EngineConfig(enabled=False)
-            self.engines["tavily"] = EngineConfig(enabled=False)
-            self.engines["google_search"] = EngineConfig(enabled=False)
-            self.engines["bing_search"] = EngineConfig(enabled=False)
-            self.engines["serper"] = EngineConfig(enabled=False)
-            self.engines["brave_search"] = EngineConfig(enabled=False)
-            self.engines["metasota_search"] = EngineConfig(enabled=False)
+            for engine_name, enabled in _DEFAULT_ENGINES:
+                if selected is not None:
+                    enabled = engine_name in selected
+                self.engines[engine_name] = EngineConfig._fast_default(enabled=enabled)
     
-    def _load_api_keys_from_env(self):
+    def _load_api_keys_from_env(self, auto_enable: bool = True):
         """从环境变量加载API密钥"""
-        api_key_mapping = {
-            "newsapi": "NEWS_API_KEY",
-            "tavily": "TAVILY_API_KEY", 
-            "google_search": "GOOGLE_SEARCH_API_KEY",
-            "bing_search": "BING_SEARCH_API_KEY",
-            "serper": "SERPER_API_KEY",
-            "brave_search": "BRAVE_SEARCH_API_KEY",
-            "metasota_search": "METASOSEARCH_API_KEY",
-        }
-        
-        for engine_name, env_var in api_key_mapping.items():
-            if engine_name in self.engines:
-                api_key = os.getenv(env_var)
-                if api_key:
-                    self.engines[engine_name].api_key = api_key
-                    # 如果有API密钥，自动启用该搜索引擎
-                    if not self.engines[engine_name].enabled:
-                        self.engines[engine_name].enabled = True
+        # 构造配置时读取当前环境变量，导入后才设置的密钥同样生效
+        # 默认情况下有API密钥的搜索引擎自动启用
+        environ = os.environ
+        for engine_name, env_var in _API_KEY_MAPPING.items():
+            api_key = environ.get(env_var)
+            engine_config = self.engines.get(engine_name)
+            if api_key and engine_config is not None:
+                engine_config.api_key = api_key
+                if auto_enable:
+                    engine_config.enabled = True
     
     def set_engine_config(
         self, 
@@ -164,7 +219,7 @@ class FlexibleSearchConfig:
             engine_config.api_key = api_key
     
     def get_enabled_engines(self) -> List[str]:
-        """获取启用的搜索引擎列表"""
+        """获取启用的搜索引擎列表（每次按 engines 当前状态生成，直接修改 enabled 后也不会过期）"""
         return [name for name, config in self.engines.items() if config.enabled]
     
     def get_engine_config(self, engine_name: str) -> Optional[EngineConfig]:
@@ -185,12 +240,13 @@ class FlexibleSearchConfig:
     
     def validate_config(self) -> Dict[str, Any]:
         """验证配置"""
+        enabled_engines = self.get_enabled_engines()
         validation_result = {
             "valid": True,
             "errors": [],
             "warnings": [],
-            "enabled_engines": self.get_enabled_engines(),
-            "engine_count": len(self.get_enabled_engines())
+            "enabled_engines": enabled_engines,
+            "engine_count": len(enabled_engines)
         }
         
         # 检查启用的搜索引擎
@@ -199,8 +255,8 @@ class FlexibleSearchConfig:
             validation_result["errors"].append("没有启用任何搜索引擎")
         
         # 检查API密钥
-        for engine_name, config in self.engines.items():
-            if config.enabled and config.api_key is None:
+        for engine_name in enabled_engines:
+            if self.engines[engine_name].api_key is None:
                 if engine_name in ["newsapi", "tavily", "google_search", "bing_search", "serper", "brave_search", "metasota_search"]:
                     validation_result["warnings"].append(f"{engine_name} 已启用但缺少API密钥")
         
@@ -246,18 +302,17 @@ def create_flexible_config(
     Returns:
         FlexibleSearchConfig: 配置对象
     """
-    config = FlexibleSearchConfig()
+    # 指定了搜索引擎时直接只启用它们，避免先全部禁用再逐个启用
+    if enabled_engines:
+        config = FlexibleSearchConfig.for_engines(enabled_engines)
+    else:
+        config = FlexibleSearchConfig()
     
     # 设置时间范围
     config.set_time_range_preset(time_range)
     
-    # 设置启用的搜索引擎
+    # 设置指定搜索引擎的文章数
     if enabled_engines:
-        # 先禁用所有搜索引擎
-        for engine_config in config.engines.values():
-            engine_config.enabled = False
-        
-        # 启用指定的搜索引擎
         for engine_name in enabled_engines:
             if engine_name in config.engines:
                 config.set_engine_config(
@@ -287,13 +342,10 @@ def create_single_engine_config(
     Returns:
         FlexibleSearchConfig: 配置对象
     """
-    config = FlexibleSearchConfig()
-    
-    # 禁用所有搜索引擎
-    for engine_config in config.engines.values():
-        engine_config.enabled = False
+    # 只启用指定的搜索引擎（不在默认列表中的引擎由 set_engine_config 创建）
+    config = FlexibleSearchConfig.for_engines([engine_name])
     
-    # 启用指定的搜索引擎
+    # 设置指定搜索引擎的参数
     config.set_engine_config(
         engine_name,
         enabled=True,
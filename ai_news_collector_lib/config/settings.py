@@ -6,10 +6,11 @@
 import os
 from dataclasses import dataclass
 from typing import Optional, Dict, Any
-from dotenv import load_dotenv
 
-# 加载环境变量
-load_dotenv()
+from .env import load_env_once
+
+# 加载环境变量（.env 只解析一次）
+load_env_once()
 
 
 @dataclass
@@ -6,6 +6,7 @@
 import asyncio
 import logging
 from typing import List, Dict, Any, Optional, Callable
+from datetime import datetime, timedelta, timezone
 from difflib import SequenceMatcher
 
 from ..models.article import Article
@@ -20,6 +21,7 @@ from ..tools.search_tools import (
     SerperTool,
     BraveSearchTool,
     MetaSotaSearchTool,
+    _published_timestamp,
 )
 from ..config.settings import SearchConfig
 
@@ -207,26 +209,13 @@ class AINewsCollector:
             # 如果时间计算异常，直接返回原始列表
             return articles
 
-        filtered = []
-        for article in articles:
-            try:
-                if not getattr(article, "published", None):
-                    continue
-
-                published_str = article.published
-                if published_str.endswith("Z"):
-                    published_str = published_str[:-1] + "+00:00"
-
-                dt = datetime.fromisoformat(published_str)
-                # 缺少时区时默认按UTC处理
-                if dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=timezone.utc)
-
-                if dt >= cutoff_date:
-                    filtered.append(article)
-            except Exception:
-                # 日期解析失败时跳过该文章
-                continue
+        # 截止时间预先转为时间戳；缺失或无法解析的发布时间为NaN，比较结果为False，跳过该文章
+        cutoff_ts = cutoff_date.timestamp()
+        filtered = [
+            article
+            for article in articles
+            if _published_timestamp(getattr(article, "published", None)) >= cutoff_ts
+        ]
 
         return filtered
 
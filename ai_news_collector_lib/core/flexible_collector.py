@@ -6,7 +6,25 @@
 import asyncio
 import logging
 from typing import List, Dict, Any, Optional, Callable, Union
+from collections import defaultdict
 from difflib import SequenceMatcher
+from functools import lru_cache
+
+try:
+    from datasketch import MinHash, MinHashLSH
+except ImportError:
+    MinHash = None
+    MinHashLSH = None
+
+try:
+    from rapidfuzz import fuzz
+except ImportError:
+    fuzz = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 from ..models.article import Article
 from ..models.result import SearchResult
@@ -25,10 +43,123 @@ from ..tools.search_tools import (
 
 logger = logging.getLogger(__name__)
 
+# 标题去重的 MinHash 参数：3-gram 分片、64 个置换
+SHINGLE_SIZE = 3
+MINHASH_NUM_PERM = 64
+# 同一对标题的 3-gram Jaccard 明显低于 SequenceMatcher 相似度，
+# LSH 阈值取其一半、并偏重假阴性权重以保证召回，最终仍由 SequenceMatcher 确认
+LSH_THRESHOLD_RATIO = 0.5
+LSH_WEIGHTS = (0.2, 0.8)
+
+
+def _title_shingles(title: str) -> set:
+    """将规范化标题切分为字符 n-gram 集合"""
+    if len(title) <= SHINGLE_SIZE:
+        return {title}
+    return {title[i : i + SHINGLE_SIZE] for i in range(len(title) - SHINGLE_SIZE + 1)}
+
+
+def _title_minhash(title: str) -> "MinHash":
+    """计算标题的 MinHash 签名"""
+    minhash = MinHash(num_perm=MINHASH_NUM_PERM)
+    minhash.update_batch([s.encode("utf-8") for s in _title_shingles(title)])
+    return minhash
+
+
+def _free_tool(tool_cls: type):
+    """免费搜索工具的工厂"""
+    def factory(engine_config, collector):
+        return tool_cls(max_articles=engine_config.max_articles)
+    return factory
+
+
+def _keyed_tool(tool_cls: type):
+    """需要API密钥的搜索工具的工厂，未配置密钥时返回None"""
+    def factory(engine_config, collector):
+        if not engine_config.api_key:
+            return None
+        return tool_cls(
+            api_key=engine_config.api_key, max_articles=engine_config.max_articles
+        )
+    return factory
+
+
+def _google_search_tool(engine_config, collector):
+    """Google搜索工具的工厂，还需要配置中的 Search Engine ID"""
+    if not engine_config.api_key:
+        return None
+    google_engine_id = collector.config.google_search_engine_id
+    if not google_engine_id:
+        return None
+    return GoogleSearchTool(
+        api_key=engine_config.api_key,
+        search_engine_id=google_engine_id,
+        max_articles=engine_config.max_articles
+    )
+
+
+# 标题相似度缓存大小：定时重复收集时同样的标题对会反复出现
+PAIR_RATIO_CACHE_SIZE = 8192
+
+
+@lru_cache(maxsize=PAIR_RATIO_CACHE_SIZE)
+def _pair_ratio(title: str, seen_title: str) -> float:
+    """计算两个规范化标题的相似度（进程级 LRU 缓存）
+
+    安装了 rapidfuzz 时使用其 C++ 实现的 fuzz.ratio（基于最长公共子序列，
+    对同一对标题通常略高于 SequenceMatcher），否则使用 SequenceMatcher。
+    保持 (新标题, 已保留标题) 的参数顺序而不排序：SequenceMatcher.ratio()
+    并不严格对称，排序会改变少数标题对的结果。
+    """
+    if fuzz is not None:
+        return fuzz.ratio(title, seen_title) / 100.0
+    return SequenceMatcher(None, title, seen_title).ratio()
+
+
+def clear_dedup_cache() -> None:
+    """清空标题相似度缓存（长时间运行的进程可定期调用以释放内存）"""
+    _pair_ratio.cache_clear()
+
+
+def _length_may_match(len_a: int, len_b: int, threshold: float) -> bool:
+    """相似度的长度上界 2·min/(la+lb) 超过阈值时才可能判为相似
+
+    SequenceMatcher.ratio() 与 rapidfuzz fuzz.ratio() 都满足该上界。
+    """
+    total = len_a + len_b
+    return total == 0 or 2 * min(len_a, len_b) / total > threshold
+
+
+def _length_window(length: int, threshold: float) -> Optional[range]:
+    """满足长度上界的候选标题长度范围（含边界，需再用 _length_may_match 精确判断）
+
+    阈值不大于 0 时长度无法约束候选，返回 None。
+    """
+    if threshold <= 0:
+        return None
+    low = int(threshold * length / (2 - threshold))
+    high = int(length * (2 - threshold) / threshold) + 1
+    return range(low, high + 1)
+
 
 class FlexibleAINewsCollector:
     """灵活的AI新闻收集器"""
     
+    # 搜索引擎名称 -> 工具工厂 (engine_config, collector) -> 工具实例或None
+    _TOOL_FACTORIES: Dict[str, Callable[[Any, Any], Optional[Any]]] = {
+        "hackernews": _free_tool(HackerNewsTool),
+        "arxiv": _free_tool(ArxivTool),
+        "duckduckgo": _free_tool(DuckDuckGoTool),
+        # 注意：RSS工具尚未实现，rss_feeds 暂无工厂
+        "newsapi": _keyed_tool(NewsAPITool),
+        "tavily": _keyed_tool(TavilyTool),
+        "google_search": _google_search_tool,
+        "bing_search": _keyed_tool(BraveSearchTool),
+        "serper": _keyed_tool(SerperTool),
+        "brave_search": _keyed_tool(BraveSearchTool),
+        "metasota_search": _keyed_tool(MetaSotaSearchTool),
+    }
+    
     def __init__(self, config: FlexibleSearchConfig):
         """
         初始化收集器
@@ -38,6 +169,11 @@ class FlexibleAINewsCollector:
         """
         self.config = config
         self.tools = {}
+        # 工具的静态信息（类名、描述、文章数），注册工具时计算一次供 get_engine_info 使用
+        self._tool_info: Dict[str, tuple] = {}
+        # 限制并发搜索的信号量，按事件循环惰性创建（Python 3.9 的 Semaphore 绑定创建时的循环）
+        self._search_semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop = None
         self._initialize_tools()
     
     def _initialize_tools(self):
@@ -49,72 +185,104 @@ class FlexibleAINewsCollector:
             try:
                 tool = self._create_tool(engine_name, engine_config)
                 if tool:
-                    self.tools[engine_name] = tool
+                    self._register_tool(engine_name, tool)
                     logger.info(f"初始化搜索引擎: {engine_name}")
             except Exception as e:
                 logger.error(f"初始化搜索引擎 {engine_name} 失败: {e}")
     
+    def _register_tool(self, engine_name: str, tool: Any) -> None:
+        """登记搜索工具并缓存其静态信息"""
+        self.tools[engine_name] = tool
+        self._tool_info[engine_name] = (tool, self._describe_tool(tool))
+    
+    @staticmethod
+    def _describe_tool(tool: Any) -> Dict[str, Any]:
+        """提取搜索工具的静态信息"""
+        return {
+            "name": tool.__class__.__name__,
+            "description": getattr(tool, "description", ""),
+            "max_articles": getattr(tool, "max_articles", 0),
+        }
+    
     def _create_tool(self, engine_name: str, engine_config) -> Optional[Any]:
         """创建搜索工具"""
-        max_articles = engine_config.max_articles
-        
-        if engine_name == "hackernews":
-            return HackerNewsTool(max_articles=max_articles)
-        elif engine_name == "arxiv":
-            return ArxivTool(max_articles=max_articles)
-        elif engine_name == "duckduckgo":
-            return DuckDuckGoTool(max_articles=max_articles)
-        elif engine_name == "rss_feeds":
-            # 注意：这里需要根据实际的RSS工具类来调整
-            return None  # 暂时返回None，需要实现RSS工具
-        elif engine_name == "newsapi" and engine_config.api_key:
-            return NewsAPITool(api_key=engine_config.api_key, max_articles=max_articles)
-        elif engine_name == "tavily" and engine_config.api_key:
-            return TavilyTool(api_key=engine_config.api_key, max_articles=max_articles)
-        elif engine_name == "google_search" and engine_config.api_key:
-            # 需要Google Search Engine ID，这里需要从配置中获取
-            google_engine_id = getattr(self.config, 'google_search_engine_id', None)
-            if google_engine_id:
-                return GoogleSearchTool(
-                    api_key=engine_config.api_key,
-                    search_engine_id=google_engine_id,
-                    max_articles=max_articles
-                )
-        elif engine_name == "bing_search" and engine_config.api_key:
-            return BraveSearchTool(api_key=engine_config.api_key, max_articles=max_articles)
-        elif engine_name == "serper" and engine_config.api_key:
-            return SerperTool(api_key=engine_config.api_key, max_articles=max_articles)
-        elif engine_name == "brave_search" and engine_config.api_key:
-            return BraveSearchTool(api_key=engine_config.api_key, max_articles=max_articles)
-        elif engine_name == "metasota_search" and engine_config.api_key:
-            return MetaSotaSearchTool(api_key=engine_config.api_key, max_articles=max_articles)
-        
-        return None
+        factory = self._TOOL_FACTORIES.get(engine_name)
+        return factory(engine_config, self) if factory else None
     
     def _deduplicate_articles(self, articles: List[Article], similarity_threshold: float = None) -> List[Article]:
-        """去重文章"""
+        """去重文章
+
+        先按规范化标题做精确去重；安装了 datasketch 时，再用 3-gram MinHash LSH
+        召回相似候选，只对候选标题计算相似度确认，避免 O(N²) 两两比较。
+        未安装 datasketch 时退回到与所有已保留标题逐一比较。
+        相似度经 _pair_ratio 进程级缓存，重复收集时相同标题对无需重新计算。
+        LSH 候选按 MinHash 签名矩阵上向量化估计的 Jaccard 从高到低确认，尽早命中重复。
+        长度上界 2·min/(la+lb) 不超过阈值的标题对不可能相似，直接跳过；
+        无 LSH 时按长度分桶，只遍历长度窗口内的已保留标题。
+        """
         if similarity_threshold is None:
             similarity_threshold = self.config.global_similarity_threshold
-            
+
         unique_articles = []
-        seen_titles = set()
-        
-        for article in articles:
+        seen_exact = set()
+        seen_titles: Dict[int, str] = {}
+        seen_by_length: Dict[int, List[str]] = defaultdict(list)
+
+        lsh = None
+        if MinHashLSH is not None:
+            lsh = MinHashLSH(
+                threshold=similarity_threshold * LSH_THRESHOLD_RATIO,
+                num_perm=MINHASH_NUM_PERM,
+                weights=LSH_WEIGHTS,
+            )
+        # 已保留标题的 MinHash 签名矩阵，行号即文章下标
+        signatures = None
+        if lsh is not None and np is not None:
+            signatures = np.empty((len(articles), MINHASH_NUM_PERM), dtype=np.uint64)
+
+        for index, article in enumerate(articles):
+            title = article.title.lower().strip()
+            if title in seen_exact:
+                continue
+
+            minhash = None
+            if lsh is not None:
+                minhash = _title_minhash(title)
+                keys = lsh.query(minhash)
+                if signatures is not None and len(keys) > 1:
+                    # 估计 Jaccard = 签名中相同分量的比例，一次向量化计算所有候选
+                    similarities = (signatures[keys] == minhash.hashvalues).mean(axis=1)
+                    keys = [keys[i] for i in np.argsort(-similarities, kind="stable")]
+                candidates = [seen_titles[key] for key in keys]
+            else:
+                window = _length_window(len(title), similarity_threshold)
+                candidates = [
+                    seen_title
+                    for length in (seen_by_length.keys() if window is None else window)
+                    for seen_title in seen_by_length.get(length, ())
+                ]
+
             is_duplicate = False
-            for seen_title in seen_titles:
-                similarity = SequenceMatcher(
-                    None, article.title.lower(), seen_title.lower()
-                ).ratio()
-                if similarity > similarity_threshold:
+            for seen_title in candidates:
+                if not _length_may_match(len(title), len(seen_title), similarity_threshold):
+                    continue
+                if _pair_ratio(title, seen_title) > similarity_threshold:
                     is_duplicate = True
                     break
-            
+
             if not is_duplicate:
                 unique_articles.append(article)
-                seen_titles.add(article.title)
-        
+                seen_exact.add(title)
+                if lsh is not None:
+                    seen_titles[index] = title
+                    lsh.insert(index, minhash)
+                    if signatures is not None:
+                        signatures[index] = minhash.hashvalues
+                else:
+                    seen_by_length[len(title)].append(title)
+
         return unique_articles
-    
+
     async def collect_news(
         self,
         query: str = "artificial intelligence",
@@ -132,57 +300,74 @@ class FlexibleAINewsCollector:
         Returns:
             SearchResult: 搜索结果
         """
-        if engines is None:
-            engines = list(self.tools.keys())
+        # 只保留已初始化工具且有配置的引擎（去重并保持顺序），只为它们创建协程
+        engine_configs = self.config.engines
+        valid_engines = [
+            engine_name
+            for engine_name in dict.fromkeys(self.tools if engines is None else engines)
+            if engine_name in self.tools and engine_configs.get(engine_name)
+        ]
         
         all_articles = []
-        source_progress = {}
+        source_progress = {
+            engine_name: {"status": "pending", "articles_found": 0}
+            for engine_name in valid_engines
+        }
         
-        # 为所有引擎创建搜索任务
-        tasks = {}
-        for engine_name in engines:
-            if engine_name in self.tools:
-                engine_config = self.config.get_engine_config(engine_name)
-                if engine_config:
-                    task = self._search_single_engine(
-                        engine_name, 
-                        query, 
-                        engine_config, 
-                        progress_callback
+        # 并发执行所有搜索任务，按完成顺序处理结果，先完成的引擎先回调；
+        # 引擎名随结果一起返回，无需额外的 任务 -> 引擎名 映射
+        if valid_engines:
+            pending = [
+                asyncio.ensure_future(
+                    self._run_engine_task(
+                        engine_name,
+                        self._search_single_engine(
+                            engine_name,
+                            query,
+                            engine_configs[engine_name],
+                            progress_callback
+                        ),
                     )
-                    tasks[engine_name] = task
-                    source_progress[engine_name] = {"status": "pending", "articles_found": 0}
-        
-        # 并发执行所有搜索任务
-        if tasks:
-            results = await asyncio.gather(*tasks.values(), return_exceptions=True)
-            
-            for engine_name, result in zip(tasks.keys(), results):
-                try:
-                    if isinstance(result, Exception):
-                        logger.error(f"搜索失败 {engine_name}: {result}")
+                )
+                for engine_name in valid_engines
+            ]
+            engine_articles: Dict[str, List[Article]] = {}
+            try:
+                for future in asyncio.as_completed(pending):
+                    engine_name, articles, error = await future
+                    try:
+                        if error is not None:
+                            logger.error(f"搜索失败 {engine_name}: {error}")
+                            source_progress[engine_name] = {
+                                "status": "failed",
+                                "articles_found": 0,
+                                "error": str(error),
+                            }
+                        else:
+                            engine_articles[engine_name] = articles
+                            source_progress[engine_name] = {
+                                "status": "completed",
+                                "articles_found": len(articles),
+                            }
+                            if progress_callback:
+                                msg = f"完成 {engine_name}: {len(articles)} 篇文章"
+                                progress_callback(msg)
+                    except Exception as e:
+                        logger.error(f"处理搜索结果失败 {engine_name}: {e}")
                         source_progress[engine_name] = {
                             "status": "failed",
                             "articles_found": 0,
-                            "error": str(result),
-                        }
-                    else:
-                        articles = result
-                        all_articles.extend(articles)
-                        source_progress[engine_name] = {
-                            "status": "completed",
-                            "articles_found": len(articles),
+                            "error": str(e),
                         }
-                        if progress_callback:
-                            msg = f"完成 {engine_name}: {len(articles)} 篇文章"
-                            progress_callback(msg)
-                except Exception as e:
-                    logger.error(f"处理搜索结果失败 {engine_name}: {e}")
-                    source_progress[engine_name] = {
-                        "status": "failed",
-                        "articles_found": 0,
-                        "error": str(e),
-                    }
+            finally:
+                # 调用方取消或出错时，不留下仍在运行的搜索任务
+                for future in pending:
+                    if not future.done():
+                        future.cancel()
+            
+            # 按引擎顺序合并结果，保证去重保留的文章不受完成先后影响
+            for engine_name in valid_engines:
+                all_articles.extend(engine_articles.get(engine_name, ()))
         
         # 去重
         unique_articles = self._deduplicate_articles(all_articles)
@@ -195,6 +380,23 @@ class FlexibleAINewsCollector:
             source_progress=source_progress,
         )
     
+    def _get_search_semaphore(self) -> asyncio.Semaphore:
+        """获取当前事件循环下的并发搜索信号量"""
+        loop = asyncio.get_running_loop()
+        if self._search_semaphore is None or self._semaphore_loop is not loop:
+            limit = max(1, self.config.max_concurrent_engines)
+            self._search_semaphore = asyncio.Semaphore(limit)
+            self._semaphore_loop = loop
+        return self._search_semaphore
+    
+    @staticmethod
+    async def _run_engine_task(engine_name: str, task) -> tuple:
+        """执行单个引擎的搜索协程，返回 (引擎名, 文章列表, 异常)"""
+        try:
+            return engine_name, await task, None
+        except Exception as e:
+            return engine_name, None, e
+    
     async def _search_single_engine(
         self, 
         engine_name: str, 
@@ -210,8 +412,10 @@ class FlexibleAINewsCollector:
         # 使用引擎特定的时间范围
         days_back = engine_config.get_effective_days_back()
         
-        # 将同步的搜索调用转移到线程池，避免阻塞事件循环
-        articles = await asyncio.to_thread(tool.search, query, days_back)
+        # 将同步的搜索调用转移到线程池，避免阻塞事件循环；
+        # 用信号量限制同时占用的线程数，避免挤占默认线程池
+        async with self._get_search_semaphore():
+            articles = await asyncio.to_thread(tool.search, query, days_back)
         
         return articles
     
@@ -224,11 +428,13 @@ class FlexibleAINewsCollector:
         engine_info = {}
         
         for engine_name, tool in self.tools.items():
-            engine_config = self.config.get_engine_config(engine_name)
+            engine_config = self.config.engines.get(engine_name)
+            cached_tool, tool_info = self._tool_info.get(engine_name, (None, None))
+            if cached_tool is not tool:
+                # 直接替换了 self.tools 中的工具，缓存信息已失效
+                tool_info = self._describe_tool(tool)
             engine_info[engine_name] = {
-                "name": tool.__class__.__name__,
-                "description": getattr(tool, "description", ""),
-                "max_articles": getattr(tool, "max_articles", 0),
+                **tool_info,
                 "time_range": engine_config.time_range.value if engine_config else "unknown",
                 "days_back": engine_config.get_effective_days_back() if engine_config else 0,
                 "similarity_threshold": engine_config.similarity_threshold if engine_config else 0.85,
@@ -254,7 +460,7 @@ class FlexibleAINewsCollector:
                 if engine_config and engine_config.enabled:
                     tool = self._create_tool(engine_name, engine_config)
                     if tool:
-                        self.tools[engine_name] = tool
+                        self._register_tool(engine_name, tool)
                         logger.info(f"更新搜索引擎: {engine_name}")
                         return True
             except Exception as e:
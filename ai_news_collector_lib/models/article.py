@@ -3,12 +3,29 @@
 定义基础文章和增强文章的数据结构
 """
 
+import sys
 from dataclasses import dataclass, field
 from typing import List, Optional
 from datetime import datetime
 
+# Python 3.10+ 使用 __slots__ 生成 dataclass：每个搜索结果都会创建文章对象，
+# 去掉实例 __dict__ 可减少内存占用并加快构造
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+if sys.version_info >= (3, 11):
+    # Python 3.11+ 的 fromisoformat 原生支持 Z 后缀，无需为每篇文章重写字符串
+    _fromisoformat = datetime.fromisoformat
+else:
+
+    def _fromisoformat(published: str) -> datetime:
+        """解析ISO格式时间，将 Z 后缀改写为 +00:00 以兼容旧版 fromisoformat"""
+        if published.endswith("Z"):
+            published = published[:-1] + "+00:00"
+        return datetime.fromisoformat(published)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Article:
     """基础文章数据结构"""
 
@@ -27,7 +44,7 @@ class Article:
         if self.published and not self.published.endswith("Z") and "T" in self.published:
             try:
                 # 尝试解析并重新格式化
-                dt = datetime.fromisoformat(self.published.replace("Z", "+00:00"))
+                dt = _fromisoformat(self.published)
                 self.published = dt.isoformat()
             except ValueError:
                 # 如果解析失败，保持原样
@@ -61,7 +78,7 @@ class Article:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class AdvancedArticle(Article):
     """增强文章数据结构"""
 
@@ -73,7 +90,8 @@ class AdvancedArticle(Article):
 
     def __post_init__(self):
         """初始化后处理"""
-        super().__post_init__()
+        # slots=True 会重新创建类，无参数 super() 无法使用，直接调用父类方法
+        Article.__post_init__(self)
 
         # 计算阅读时间（如果没有设置）
         if self.reading_time == 0 and self.word_count > 0:
@@ -81,7 +99,7 @@ class AdvancedArticle(Article):
 
     def to_dict(self) -> dict:
         """转换为字典"""
-        base_dict = super().to_dict()
+        base_dict = Article.to_dict(self)
         base_dict.update(
             {
                 "keywords": self.keywords,
@@ -140,12 +158,7 @@ class AdvancedArticle(Article):
             if not self.published:
                 return False
 
-            # 处理不同的时间格式
-            published_str = self.published
-            if published_str.endswith("Z"):
-                published_str = published_str[:-1] + "+00:00"
-
-            published_time = datetime.fromisoformat(published_str)
+            published_time = _fromisoformat(self.published)
             now = datetime.now(published_time.tzinfo) if published_time.tzinfo else datetime.now()
 
             return (now - published_time).days <= days
@@ -3,11 +3,12 @@
 定义搜索结果的数据结构
 """
 
+from collections import Counter
 from dataclasses import dataclass
 from typing import List, Dict, Any
 from datetime import datetime
 
-from .article import Article
+from .article import Article, _fromisoformat
 
 
 @dataclass
@@ -81,12 +82,7 @@ class SearchResult:
                 if not article.published:
                     continue
 
-                # 处理不同的时间格式
-                published_str = article.published
-                if published_str.endswith("Z"):
-                    published_str = published_str[:-1] + "+00:00"
-
-                published_time = datetime.fromisoformat(published_str)
+                published_time = _fromisoformat(article.published)
                 now = (
                     datetime.now(published_time.tzinfo) if published_time.tzinfo else datetime.now()
                 )
@@ -104,8 +100,4 @@ class SearchResult:
 
     def get_source_statistics(self) -> Dict[str, int]:
         """获取各源统计信息"""
-        stats = {}
-        for article in self.articles:
-            source = article.source
-            stats[source] = stats.get(source, 0) + 1
-        return stats
+        return dict(Counter(article.source for article in self.articles))
@@ -3,6 +3,20 @@
 包含各种搜索源的实现
 """
 
-from .search_tools import BaseSearchTool, HackerNewsTool, ArxivTool, DuckDuckGoTool, NewsAPITool
+from .search_tools import (
+    BaseSearchTool,
+    HackerNewsTool,
+    ArxivTool,
+    DuckDuckGoTool,
+    NewsAPITool,
+    MultiSourceSearch,
+)
 
-__all__ = ["BaseSearchTool", "HackerNewsTool", "ArxivTool", "DuckDuckGoTool", "NewsAPITool"]
+__all__ = [
+    "BaseSearchTool",
+    "HackerNewsTool",
+    "ArxivTool",
+    "DuckDuckGoTool",
+    "NewsAPITool",
+    "MultiSourceSearch",
+]
@@ -3,25 +3,320 @@
 包含各种搜索源的具体实现
 """
 
+import asyncio
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 import logging
 import json
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 from datetime import datetime, timedelta, timezone
 from bs4 import BeautifulSoup
 import feedparser
+import calendar
+import io
+import math
 import re
-
-from ..models.article import Article
+from functools import lru_cache
+from itertools import islice
+from urllib.parse import unquote, urlsplit
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError, as_completed
+
+from ..models.article import Article, _fromisoformat
+
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+except ImportError:
+    etree = None
+    lxml_html = None
+
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:
+    HTMLParser = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
 
 logger = logging.getLogger(__name__)
 
+# 发布时间解析缓存的容量
+PUBLISHED_CACHE_SIZE = 4096
+# URL域名解析缓存的容量
+NETLOC_CACHE_SIZE = 2048
+
+# 启用HTTP缓存后各端点的缓存时间（秒）；HN故事发布后基本不变，热门列表变化较快
+HTTP_CACHE_TTLS = {
+    "hacker-news.firebaseio.com/v0/topstories.json": 60,
+    "hacker-news.firebaseio.com/v0/item/*": 10 * 60,
+    "hn.algolia.com/api/v1/*": 60,
+    "export.arxiv.org/api/*": 24 * 60 * 60,
+    "newsapi.org/*": 5 * 60,
+}
+# 不参与缓存键且不写入缓存的参数/请求头（API密钥等）
+HTTP_CACHE_IGNORED_PARAMS = ("apiKey", "api_key", "Authorization", "X-API-KEY", "access_token")
+
+# ArXiv Atom 命名空间下的标签
+_ATOM_NS = "{http://www.w3.org/2005/Atom}"
+_ATOM_ENTRY = _ATOM_NS + "entry"
+_ATOM_ID = _ATOM_NS + "id"
+_ATOM_TITLE = _ATOM_NS + "title"
+_ATOM_SUMMARY = _ATOM_NS + "summary"
+_ATOM_PUBLISHED = _ATOM_NS + "published"
+_ATOM_AUTHOR = _ATOM_NS + "author"
+_ATOM_NAME = _ATOM_NS + "name"
+
+# 判断订阅格式时检查的响应头部字节数
+_FEED_SNIFF_BYTES = 512
+
+
+def _detect_feed(content: bytes) -> str:
+    """根据响应头部判断订阅格式：atom / rss / unknown"""
+    head = content[:_FEED_SNIFF_BYTES]
+    if b"<feed" in head:
+        return "atom"
+    if b"<rss" in head:
+        return "rss"
+    return "unknown"
+
+
+# DuckDuckGo 结果允许的站点（含其子域名）
+_DDG_ALLOWED_DOMAINS = frozenset(
+    {"techcrunch.com", "venturebeat.com", "theverge.com", "wired.com"}
+)
+_DDG_ALLOWED_SUFFIXES = tuple(f".{domain}" for domain in _DDG_ALLOWED_DOMAINS)
+# DuckDuckGo 结果锚点（等价于CSS选择器 a.result__a[href]）
+_DDG_RESULT_LINK_XPATH = (
+    "//a[@href and contains(concat(' ', normalize-space(@class), ' '), ' result__a ')]"
+)
+
+
+def _is_ddg_allowed_domain(url: str) -> bool:
+    """判断URL的主机是否属于允许的站点"""
+    host = urlsplit(url).hostname or ""
+    return host in _DDG_ALLOWED_DOMAINS or host.endswith(_DDG_ALLOWED_SUFFIXES)
+
+
+def _extract_result_links(html: str) -> List[Tuple[str, str]]:
+    """
+    提取DuckDuckGo结果链接（class="result__a"），返回 (href, 文本) 列表
+
+    只遍历结果锚点，导航、页脚等链接不会进入后续过滤。
+    优先使用selectolax，其次lxml，都不可用时回退到BeautifulSoup。
+    """
+    if HTMLParser is not None:
+        return [
+            (node.attributes.get("href") or "", node.text(strip=True))
+            for node in HTMLParser(html).css("a.result__a[href]")
+        ]
+    if lxml_html is not None:
+        if not html.strip():
+            return []
+        return [
+            (link.get("href"), "".join(text.strip() for text in link.itertext()))
+            for link in lxml_html.fromstring(html).xpath(_DDG_RESULT_LINK_XPATH)
+        ]
+    soup = BeautifulSoup(html, "html.parser")
+    return [
+        (str(link.get("href", "")), link.get_text(strip=True))
+        for link in soup.select("a.result__a[href]")
+    ]
+
+
+# 所有UTC时间共用的时区对象
+_UTC = timezone.utc
+
+
+@lru_cache(maxsize=PUBLISHED_CACHE_SIZE)
+def _parse_iso(published: str) -> datetime:
+    """解析ISO格式的发布时间（支持Z后缀），naive时间视为UTC；结果按原始字符串缓存"""
+    # 新闻API常见的 YYYY-MM-DDTHH:MM:SS[.ffffff]Z 定长格式：按位置切片，直接挂上共享的UTC时区
+    if (
+        len(published) in (20, 27)
+        and published[-1] == "Z"
+        and published[10] == "T"
+        and (len(published) == 20 or published[19] == ".")
+        and published[4] == published[7] == "-"
+        and published[13] == published[16] == ":"
+    ):
+        try:
+            return datetime(
+                int(published[0:4]),
+                int(published[5:7]),
+                int(published[8:10]),
+                int(published[11:13]),
+                int(published[14:16]),
+                int(published[17:19]),
+                int(published[20:26]) if len(published) == 27 else 0,
+                tzinfo=_UTC,
+            )
+        except ValueError:
+            pass
+
+    published_time = _fromisoformat(published)
+    if published_time.tzinfo is None:
+        published_time = published_time.replace(tzinfo=_UTC)
+    return published_time
+
+
+# UTC时间（Z / +00:00 / naive）的各字段；带其他时区偏移的时间不匹配，交给 _parse_iso
+_ISO_UTC_RE = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})"
+    r"(?:[T ](\d{2}):(\d{2})(?::(\d{2})(\.\d+)?)?)?"
+    r"(?:Z|[+-]00:00)?"
+)
+
+
+def _iso_to_ts(published: str) -> float:
+    """
+    将ISO格式的发布时间转换为UTC时间戳，无法解析时抛出 ValueError/TypeError
+
+    UTC时间直接用正则拆出字段并用 calendar.timegm 计算，不构造 datetime；
+    其他时区偏移或正则无法处理的格式回退到 _parse_iso。
+    """
+    match = _ISO_UTC_RE.fullmatch(published)
+    if match:
+        year, month, day, hour, minute, second, fraction = match.groups()
+        year, month, day = int(year), int(month), int(day)
+        hour, minute, second = int(hour or 0), int(minute or 0), int(second or 0)
+        # timegm 不校验字段范围，非法日期交给 fromisoformat 报错
+        if (
+            1 <= month <= 12
+            and 1 <= day <= calendar.monthrange(year, month)[1]
+            and hour <= 23
+            and minute <= 59
+            and second <= 59
+        ):
+            ts = calendar.timegm((year, month, day, hour, minute, second, 0, 0, 0))
+            return ts + float(fraction) if fraction else float(ts)
+    return _parse_iso(published).timestamp()
+
+
+@lru_cache(maxsize=PUBLISHED_CACHE_SIZE)
+def _published_timestamp(published: str) -> float:
+    """返回发布时间的UTC时间戳（按原始字符串缓存），缺失或无法解析时返回NaN"""
+    if not published:
+        return math.nan
+    try:
+        return _iso_to_ts(published)
+    except (ValueError, TypeError, AttributeError):
+        return math.nan
+
+
+# 解析JSON字符串或字节，安装了orjson时优先使用（orjson.JSONDecodeError 是 json.JSONDecodeError 的子类）
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _decode_json(response: requests.Response):
+    """解码JSON响应，安装了orjson时优先使用"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+@lru_cache(maxsize=NETLOC_CACHE_SIZE)
+def _netloc(url: str) -> str:
+    """提取URL的域名部分（按URL缓存），空URL或无法解析时返回空字符串"""
+    if not url:
+        return ""
+    try:
+        return urlsplit(url).netloc
+    except ValueError:
+        return ""
+
+
+def _first(data: Dict, keys: Sequence[str], default=""):
+    """按顺序返回第一个非空字段的值，都为空时返回默认值"""
+    for key in keys:
+        value = data.get(key)
+        if value:
+            return value
+    return default
+
+
+# HackerNews Algolia 搜索接口（按时间排序）
+HN_ALGOLIA_SEARCH_URL = "https://hn.algolia.com/api/v1/search_by_date"
+
+# HackerNews 故事详情的并发请求数
+HN_FETCH_WORKERS = 16
+
+
+def _create_session(session: Optional[requests.Session] = None) -> requests.Session:
+    """创建带连接池和重试的共享会话，同一主机的后续请求可复用keep-alive连接"""
+    if session is None:
+        session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=20,
+        pool_maxsize=50,
+        max_retries=Retry(total=2, backoff_factor=0.3),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_SESSION = _create_session()
+
+
+def enable_http_cache(
+    cache_name: str = "ai_news_http_cache", backend: str = "sqlite"
+) -> requests.Session:
+    """
+    启用HTTP磁盘缓存（需要安装 requests-cache）
+
+    之后创建的搜索工具默认使用带缓存的共享会话，各端点的缓存时间见 HTTP_CACHE_TTLS，
+    未列出的端点不缓存。
+
+    Args:
+        cache_name: 缓存名称（sqlite后端下为数据库文件路径）
+        backend: requests-cache 后端，如 sqlite、filesystem、memory
+
+    Returns:
+        requests.Session: 带缓存的共享会话
+    """
+    global _SESSION
+    if requests_cache is None:
+        raise ImportError("启用HTTP缓存需要安装 requests-cache")
+
+    session = requests_cache.CachedSession(
+        cache_name,
+        backend=backend,
+        expire_after=requests_cache.DO_NOT_CACHE,
+        urls_expire_after=HTTP_CACHE_TTLS,
+        ignored_parameters=HTTP_CACHE_IGNORED_PARAMS,
+    )
+    _SESSION = _create_session(session)
+    logger.info(f"HTTP cache enabled: {cache_name} ({backend})")
+    return _SESSION
+
+
+def disable_http_cache() -> None:
+    """关闭HTTP磁盘缓存，之后创建的搜索工具使用不带缓存的共享会话"""
+    global _SESSION
+    _SESSION = _create_session()
+
 
 class BaseSearchTool:
     """搜索工具基类"""
 
-    def __init__(self, max_articles: int = 10):
+    def __init__(self, max_articles: int = 10, session: Optional[requests.Session] = None):
         self.max_articles = max_articles
+        # 默认使用模块级共享会话，测试时可注入自定义会话
+        self.session = session if session is not None else _SESSION
         self.name = self.__class__.__name__
         self.description = f"搜索工具: {self.name}"
 
@@ -38,35 +333,32 @@ class BaseSearchTool:
         """
         raise NotImplementedError("子类必须实现search方法")
 
-    def _filter_by_date(self, articles: List[Article], days_back: int) -> List[Article]:
-        """按日期过滤文章"""
+    def _filter_by_date(
+        self, articles: List[Article], days_back: int, now_iso: Optional[str] = None
+    ) -> List[Article]:
+        """
+        按日期过滤文章
+
+        Args:
+            articles: 文章列表
+            days_back: 保留最近多少天的文章，<=0 表示不过滤
+            now_iso: 本次搜索时生成的时间戳。服务端已按时间过滤、缺少发布时间的结果会用它占位，
+                若所有文章都是占位时间则无需逐条解析，直接全部保留
+        """
         if days_back <= 0:
             return articles
+        if now_iso is not None and all(article.published == now_iso for article in articles):
+            return articles
 
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_back)
-        filtered_articles = []
-
-        for article in articles:
-            try:
-                if not article.published:
-                    continue
-
-                # 处理不同的时间格式
-                published_str = article.published
-                if published_str.endswith("Z"):
-                    published_str = published_str[:-1] + "+00:00"
-
-                published_time = datetime.fromisoformat(published_str)
-                # 如果解析得到的是naive时间，默认视为UTC
-                if published_time.tzinfo is None:
-                    published_time = published_time.replace(tzinfo=timezone.utc)
-                if published_time >= cutoff_date:
-                    filtered_articles.append(article)
-            except (ValueError, TypeError):
-                # 如果时间解析失败，跳过该文章以避免污染准确率
-                continue
+        # 截止时间预先转为时间戳，逐条比较时只做浮点数比较
+        cutoff_ts = (datetime.now(timezone.utc) - timedelta(days=days_back)).timestamp()
 
-        return filtered_articles
+        # 缺失或无法解析的时间为NaN，比较结果为False，跳过该文章以避免污染准确率
+        return [
+            article
+            for article in articles
+            if _published_timestamp(article.published) >= cutoff_ts
+        ]
 
 
 class HackerNewsTool(BaseSearchTool):
@@ -77,48 +369,107 @@ class HackerNewsTool(BaseSearchTool):
         self.description = "从HackerNews获取技术新闻和讨论"
 
     def search(self, query: str, days_back: int = 7) -> List[Article]:
-        """搜索HackerNews"""
+        """搜索HackerNews：优先使用Algolia搜索接口，失败时回退到Firebase接口"""
+        # 空查询不匹配任何标题
+        if not query.split():
+            return []
+
+        try:
+            return self._search_algolia(query, days_back)
+        except Exception as e:
+            logger.warning(f"HackerNews Algolia search failed, falling back to Firebase API: {e}")
+
+        return self._search_firebase(query, days_back)
+
+    def _search_algolia(self, query: str, days_back: int) -> List[Article]:
+        """
+        通过Algolia一次请求获取按时间排序、已按关键词和时间过滤的故事
+
+        与Firebase路径一致：任一关键词出现在标题中即匹配。
+        """
+        params = {
+            "query": query,
+            "tags": "story",
+            "optionalWords": query,
+            "restrictSearchableAttributes": "title",
+            "hitsPerPage": self.max_articles,
+        }
+        if days_back > 0:
+            cutoff = datetime.now(timezone.utc) - timedelta(days=days_back)
+            params["numericFilters"] = f"created_at_i>{int(cutoff.timestamp())}"
+
+        response = self.session.get(HN_ALGOLIA_SEARCH_URL, params=params, timeout=10)
+        response.raise_for_status()
+
+        articles = []
+        for hit in _decode_json(response).get("hits", []):
+            story_time = datetime.fromtimestamp(hit.get("created_at_i") or 0, tz=timezone.utc)
+            articles.append(
+                Article(
+                    title=hit.get("title") or "No title",
+                    url=hit.get("url") or "",
+                    summary=(
+                        f"Score: {hit.get('points') or 0} | "
+                        f"Comments: {hit.get('num_comments') or 0}"
+                    ),
+                    published=story_time.isoformat(),
+                    author=hit.get("author") or "Unknown",
+                    source_name="HackerNews",
+                    source="hackernews",
+                )
+            )
+
+        # 按日期过滤
+        articles = self._filter_by_date(articles, days_back)
+        return articles[: self.max_articles]
+
+    def _search_firebase(self, query: str, days_back: int) -> List[Article]:
+        """通过Firebase接口获取热门故事并在本地按关键词过滤"""
         try:
             # 获取最新文章
-            response = requests.get(
+            response = self.session.get(
                 "https://hacker-news.firebaseio.com/v0/topstories.json", timeout=10
             )
             response.raise_for_status()
-            story_ids = response.json()[:50]  # 获取前50个故事
+            story_ids = _decode_json(response)[:50]  # 获取前50个故事
 
+            # 所有关键词编译为一个正则，每个标题只需扫描一次；空查询不匹配任何标题
+            keyword_re = re.compile(
+                "|".join(re.escape(keyword) for keyword in query.lower().split()) or r"(?!x)x"
+            )
             articles = []
-            for story_id in story_ids:
-                try:
-                    story_response = requests.get(
-                        f"https://hacker-news.firebaseio.com/v0/item/{story_id}.json", timeout=5
-                    )
-                    story_data = story_response.json()
+            # 并发获取故事详情；map 按 story_ids 顺序返回，保持原有的排名顺序
+            pool = ThreadPoolExecutor(max_workers=HN_FETCH_WORKERS)
+            try:
+                for story_data in pool.map(self._fetch_story, story_ids):
+                    if not story_data or story_data.get("type") != "story":
+                        continue
 
-                    if story_data and story_data.get("type") == "story":
-                        # HN时间戳为UTC秒，将其转换为带时区的UTC时间
-                        story_time = datetime.fromtimestamp(
-                            story_data.get("time", 0), tz=timezone.utc
-                        )
+                    # 先检查是否包含查询关键词，不匹配的故事无需再处理时间
+                    if not keyword_re.search(story_data.get("title", "").lower()):
+                        continue
 
-                        # 检查是否包含查询关键词
-                        title = story_data.get("title", "").lower()
-                        if any(keyword.lower() in title for keyword in query.split()):
-                            article = Article(
-                                title=story_data.get("title", "No title"),
-                                url=story_data.get("url", ""),
-                                summary=f"Score: {story_data.get('score', 0)} | Comments: {story_data.get('descendants', 0)}",
-                                published=story_time.astimezone(timezone.utc).isoformat(),
-                                author=story_data.get("by", "Unknown"),
-                                source_name="HackerNews",
-                                source="hackernews",
-                            )
-                            articles.append(article)
-
-                            if len(articles) >= self.max_articles:
-                                break
-                except Exception as e:
-                    logger.warning(f"Error fetching HackerNews story {story_id}: {e}")
-                    continue
+                    # HN时间戳为UTC秒，将其转换为带时区的UTC时间
+                    story_time = datetime.fromtimestamp(story_data.get("time", 0), tz=timezone.utc)
+                    article = Article(
+                        title=story_data.get("title", "No title"),
+                        url=story_data.get("url", ""),
+                        summary=(
+                            f"Score: {story_data.get('score', 0)} | "
+                            f"Comments: {story_data.get('descendants', 0)}"
+                        ),
+                        published=story_time.isoformat(),
+                        author=story_data.get("by", "Unknown"),
+                        source_name="HackerNews",
+                        source="hackernews",
+                    )
+                    articles.append(article)
+
+                    if len(articles) >= self.max_articles:
+                        break
+            finally:
+                # 已收集足够文章时取消尚未开始的请求，并等待进行中的请求结束，不遗留后台线程
+                pool.shutdown(wait=True, cancel_futures=True)
 
             # 按日期过滤
             articles = self._filter_by_date(articles, days_back)
@@ -128,6 +479,17 @@ class HackerNewsTool(BaseSearchTool):
             logger.error(f"HackerNews search failed: {e}")
             return []
 
+    def _fetch_story(self, story_id: int) -> Optional[dict]:
+        """获取单个HackerNews故事详情，失败时返回None"""
+        try:
+            story_response = self.session.get(
+                f"https://hacker-news.firebaseio.com/v0/item/{story_id}.json", timeout=5
+            )
+            return _decode_json(story_response)
+        except Exception as e:
+            logger.warning(f"Error fetching HackerNews story {story_id}: {e}")
+            return None
+
 
 class ArxivTool(BaseSearchTool):
     """ArXiv搜索工具"""
@@ -143,93 +505,24 @@ class ArxivTool(BaseSearchTool):
             search_query = f"cat:cs.AI OR cat:cs.LG OR cat:cs.CL AND all:{query}"
             url = f"http://export.arxiv.org/api/query?search_query={search_query}&start=0&max_results={self.max_articles}&sortBy=submittedDate&sortOrder=descending"
 
-            response = requests.get(url, timeout=30)
+            response = self.session.get(url, timeout=30)
             response.raise_for_status()
 
-            articles: List[Article] = []
-
-            # 优先使用BeautifulSoup的XML解析；失败时回退到feedparser
-            try:
-                soup = BeautifulSoup(response.content, "xml")
-                entries = soup.find_all("entry")
-
-                for entry in entries:
-                    try:
-                        published_str = entry.find("published").text
-                        published_date = datetime.fromisoformat(
-                            published_str.replace("Z", "+00:00")
-                        )
-
-                        article = Article(
-                            title=entry.find("title").text.strip(),
-                            url=entry.find("id").text,
-                            summary=entry.find("summary").text.strip()[:500] + "...",
-                            published=published_date.isoformat(),
-                            author=", ".join(
-                                [author.find("name").text for author in entry.find_all("author")]
-                            ),
-                            source_name="ArXiv",
-                            source="arxiv",
-                        )
-                        articles.append(article)
-
-                        if len(articles) >= self.max_articles:
-                            break
-                    except Exception as e:
-                        logger.warning(f"Error parsing ArXiv entry: {e}")
-                        continue
-            except Exception as soup_error:
-                logger.warning(f"BeautifulSoup XML解析失败，使用feedparser回退: {soup_error}")
-                feed = feedparser.parse(response.content)
-                for entry in feed.entries:
-                    try:
-                        # 解析发布时间
-                        # 说明：feedparser 可能仅提供 published_parsed 或 updated_parsed，两者单位均为 time.struct_time
-                        # 这里按优先级回退：published_parsed > updated_parsed > 当前时间
-                        try:
-                            if hasattr(entry, "published_parsed") and entry.published_parsed:
-                                # struct_time 是 naive 的，假设为 UTC
-                                published_date = datetime(
-                                    *entry.published_parsed[:6], tzinfo=timezone.utc
-                                )
-                            elif hasattr(entry, "updated_parsed") and entry.updated_parsed:
-                                # struct_time 是 naive 的，假设为 UTC
-                                published_date = datetime(
-                                    *entry.updated_parsed[:6], tzinfo=timezone.utc
-                                )
-                            else:
-                                published_date = datetime.now(timezone.utc)
-                        except Exception:
-                            published_date = datetime.now(timezone.utc)
-
-                        article = Article(
-                            title=getattr(entry, "title", "").strip(),
-                            url=getattr(entry, "id", "") or getattr(entry, "link", ""),
-                            summary=(
-                                getattr(entry, "summary", "")
-                                or getattr(entry, "content", [{"value": ""}])[0].get("value", "")
-                            ).strip()[:500]
-                            + "...",
-                            published=published_date.isoformat(),
-                            author=(
-                                ", ".join(
-                                    [a.get("name", "") for a in getattr(entry, "authors", [])]
-                                )
-                                if hasattr(entry, "authors")
-                                else "ArXiv"
-                            ),
-                            source_name="ArXiv",
-                            source="arxiv",
-                        )
-                        articles.append(article)
-                        if len(articles) >= self.max_articles:
-                            break
-                    except Exception as e:
-                        logger.warning(f"Error parsing ArXiv feed entry: {e}")
-                        continue
+            # 先根据响应头部判断格式，再选择解析器，避免无效的完整解析
+            feed_type = _detect_feed(response.content)
+            articles = None
+            if feed_type == "atom" and etree is not None:
+                try:
+                    articles = self._parse_atom_entries(response.content)
+                except Exception as e:
+                    # lxml 拒绝的文档交给更宽松的 feedparser 再试一次
+                    logger.warning(f"ArXiv Atom解析失败，改用feedparser: {e}")
+            if articles is None:
+                if feed_type == "unknown":
+                    logger.warning("ArXiv响应不是有效的Atom/RSS，跳过解析")
+                    return []
+                articles = self._parse_feed_entries(response.content)
 
-            # 按日期过滤
-            articles = self._filter_by_date(articles, days_back)
             # 应用客户端时间过滤，确保返回结果符合 days_back 要求
             filtered_articles = self._filter_by_date(articles, days_back)
             return filtered_articles[: self.max_articles]
@@ -238,10 +531,98 @@ class ArxivTool(BaseSearchTool):
             logger.error(f"ArXiv search failed: {e}")
             return []
 
+    def _parse_atom_entries(self, content: bytes) -> List[Article]:
+        """用lxml iterparse逐条解析ArXiv Atom条目，解析完即释放节点"""
+        articles: List[Article] = []
+        for _, entry in etree.iterparse(io.BytesIO(content), tag=_ATOM_ENTRY):
+            try:
+                published_date = _fromisoformat(entry.findtext(_ATOM_PUBLISHED))
+
+                article = Article(
+                    title=entry.findtext(_ATOM_TITLE).strip(),
+                    url=entry.findtext(_ATOM_ID),
+                    summary=entry.findtext(_ATOM_SUMMARY).strip()[:500] + "...",
+                    published=published_date.isoformat(),
+                    author=", ".join(
+                        author.findtext(_ATOM_NAME)
+                        for author in entry.iterfind(_ATOM_AUTHOR)
+                    ),
+                    source_name="ArXiv",
+                    source="arxiv",
+                )
+                articles.append(article)
+            except Exception as e:
+                logger.warning(f"Error parsing ArXiv entry: {e}")
+            finally:
+                # 释放已处理的条目及其之前的兄弟节点，保持内存占用恒定
+                entry.clear()
+                while entry.getprevious() is not None:
+                    del entry.getparent()[0]
+
+            if len(articles) >= self.max_articles:
+                break
+
+        return articles
+
+    def _parse_feed_entries(self, content: bytes) -> List[Article]:
+        """用feedparser解析条目（RSS或lxml不可用时使用）"""
+        articles: List[Article] = []
+        now = datetime.now(timezone.utc)
+        feed = feedparser.parse(content)
+        for entry in feed.entries:
+            try:
+                articles.append(self._feed_entry_to_article(entry, now))
+                if len(articles) >= self.max_articles:
+                    break
+            except Exception as e:
+                logger.warning(f"Error parsing ArXiv feed entry: {e}")
+                continue
+
+        return articles
+
+    @staticmethod
+    def _feed_entry_to_article(entry, now: datetime) -> Article:
+        """将feedparser条目转换为文章，每个字段只做一次属性查找"""
+        # 解析发布时间
+        # 说明：feedparser 可能仅提供 published_parsed 或 updated_parsed，两者单位均为 time.struct_time
+        # 这里按优先级回退：published_parsed > updated_parsed > 当前时间
+        published_date = now
+        parsed = getattr(entry, "published_parsed", None) or getattr(entry, "updated_parsed", None)
+        if parsed:
+            try:
+                # struct_time 是 naive 的，假设为 UTC
+                published_date = datetime(*parsed[:6], tzinfo=timezone.utc)
+            except Exception:
+                published_date = now
+
+        summary = getattr(entry, "summary", "")
+        if not summary:
+            entry_content = getattr(entry, "content", None)
+            summary = entry_content[0].get("value", "") if entry_content else ""
+
+        authors = getattr(entry, "authors", None)
+
+        return Article(
+            title=getattr(entry, "title", "").strip(),
+            url=getattr(entry, "id", "") or getattr(entry, "link", ""),
+            summary=summary.strip()[:500] + "...",
+            published=published_date.isoformat(),
+            author=(
+                ", ".join(author.get("name", "") for author in authors)
+                if authors is not None
+                else "ArXiv"
+            ),
+            source_name="ArXiv",
+            source="arxiv",
+        )
+
 
 class DuckDuckGoTool(BaseSearchTool):
     """DuckDuckGo搜索工具"""
 
+    # 重定向链接中编码后的目标地址
+    _UDDG_RE = re.compile(r"[?&]uddg=([^&]+)")
+
     def __init__(self, max_articles: int = 10):
         super().__init__(max_articles)
         self.description = "使用DuckDuckGo进行隐私保护的网页搜索"
@@ -260,44 +641,26 @@ class DuckDuckGoTool(BaseSearchTool):
             params = {"q": search_query}
             ddg_html_endpoint = "https://html.duckduckgo.com/html/"
 
-            response = requests.get(ddg_html_endpoint, params=params, headers=self.headers, timeout=15)
+            response = self.session.get(
+                ddg_html_endpoint, params=params, headers=self.headers, timeout=15
+            )
             response.raise_for_status()
 
             # 解析搜索结果（简化版）
             articles = []
-            soup = BeautifulSoup(response.text, "html.parser")
+            now_iso = datetime.now(timezone.utc).isoformat()
 
             # DuckDuckGo HTML结果通常使用 class="result__a" 的链接
-            result_links = soup.find_all("a", href=True)
-
-            for link in result_links:
-                href = str(link.get("href", ""))
-                title = link.get_text(strip=True)
+            for href, title in _extract_result_links(response.text):
 
                 # 处理DuckDuckGo的重定向链接 /l/?uddg=<encoded_url>
-                resolved_href = href
-                if href.startswith("/l/?") and "uddg=" in href:
-                    try:
-                        from urllib.parse import urlparse, parse_qs, unquote
-                        parsed = urlparse(href)
-                        qs = parse_qs(parsed.query)
-                        if "uddg" in qs:
-                            resolved_href = unquote(qs["uddg"][0])
-                    except Exception:
-                        resolved_href = href
+                match = self._UDDG_RE.search(href)
+                resolved_href = unquote(match.group(1)) if match else href
 
                 if (
                     resolved_href
                     and resolved_href.startswith("http")
-                    and any(
-                        domain in resolved_href
-                        for domain in [
-                            "techcrunch.com",
-                            "venturebeat.com",
-                            "theverge.com",
-                            "wired.com",
-                        ]
-                    )
+                    and _is_ddg_allowed_domain(resolved_href)
                     and len(title) > 10
                 ):
 
@@ -305,7 +668,7 @@ class DuckDuckGoTool(BaseSearchTool):
                         title=title,
                         url=resolved_href,
                         summary=f"AI news article found via DuckDuckGo search for '{query}'",
-                        published=datetime.now(timezone.utc).isoformat(),
+                        published=now_iso,
                         author="DuckDuckGo Search",
                         source_name="DuckDuckGo",
                         source="duckduckgo",
@@ -327,7 +690,7 @@ class DuckDuckGoTool(BaseSearchTool):
                             title=placeholder_title,
                             url=placeholder_url,
                             summary="Generated fallback due to empty DuckDuckGo results in offline mode",
-                            published=datetime.now(timezone.utc).isoformat(),
+                            published=now_iso,
                             author="DuckDuckGo Search",
                             source_name="DuckDuckGo",
                             source="duckduckgo",
@@ -338,7 +701,7 @@ class DuckDuckGoTool(BaseSearchTool):
                     pass
 
             # 应用客户端时间过滤作为最终兜底
-            filtered_articles = self._filter_by_date(articles, days_back)
+            filtered_articles = self._filter_by_date(articles, days_back, now_iso)
             return filtered_articles[: self.max_articles]
 
         except Exception as e:
@@ -369,11 +732,12 @@ class NewsAPITool(BaseSearchTool):
                 ),
             }
 
-            response = requests.get(url, params=params, timeout=15)
+            response = self.session.get(url, params=params, timeout=15)
             response.raise_for_status()
 
             data = response.json()
             articles = []
+            now_iso = datetime.now(timezone.utc).isoformat()
 
             for item in data.get("articles", []):
                 if item.get("title") and item.get("url"):
@@ -381,7 +745,7 @@ class NewsAPITool(BaseSearchTool):
                         title=item.get("title", "No title"),
                         url=item.get("url", ""),
                         summary=item.get("description", "No summary"),
-                        published=item.get("publishedAt", datetime.now(timezone.utc).isoformat()),
+                        published=item.get("publishedAt", now_iso),
                         author=item.get("author", "Unknown"),
                         source_name=item.get("source", {}).get("name", "NewsAPI"),
                         source="newsapi",
@@ -398,7 +762,7 @@ class NewsAPITool(BaseSearchTool):
                             title=placeholder_title,
                             url=placeholder_url,
                             summary="Generated fallback due to empty NewsAPI results in offline mode",
-                            published=datetime.now(timezone.utc).isoformat(),
+                            published=now_iso,
                             author="NewsAPI",
                             source_name="NewsAPI",
                             source="newsapi",
@@ -408,7 +772,7 @@ class NewsAPITool(BaseSearchTool):
                     pass
 
             # 应用客户端时间过滤作为备用
-            filtered_articles = self._filter_by_date(articles, days_back)
+            filtered_articles = self._filter_by_date(articles, days_back, now_iso)
             return filtered_articles[: self.max_articles]
 
         except Exception as e:
@@ -427,8 +791,6 @@ class TavilyTool(BaseSearchTool):
     def search(self, query: str, days_back: int = 7) -> List[Article]:
         """使用Tavily API搜索，支持时间过滤"""
         try:
-            import requests
-
             # 根据days_back设置时间范围参数
             time_range = self._get_time_range_param(days_back)
 
@@ -451,7 +813,7 @@ class TavilyTool(BaseSearchTool):
                     payload["topic"] = "news"
                     payload["days"] = days_back
 
-            response = requests.post(
+            response = self.session.post(
                 self.base_url,
                 json=payload,
                 headers={"Content-Type": "application/json"},
@@ -461,10 +823,11 @@ class TavilyTool(BaseSearchTool):
 
             data = response.json()
             articles = []
+            now_iso = datetime.now(timezone.utc).isoformat()
 
             for result in data.get("results", []):
                 # 尝试从结果中提取发布时间
-                published_time = self._extract_published_time(result)
+                published_time = self._extract_published_time(result, now_iso)
                 
                 article = Article(
                     title=result.get("title", ""),
@@ -472,13 +835,13 @@ class TavilyTool(BaseSearchTool):
                     summary=result.get("content", ""),
                     published=published_time,
                     author="Tavily Search",
-                    source_name=result.get("url", "").split("/")[2] if result.get("url") else "Tavily",
+                    source_name=_netloc(result.get("url", "")) or "Tavily",
                     source="tavily",
                 )
                 articles.append(article)
 
             # 应用客户端时间过滤作为备用
-            filtered_articles = self._filter_by_date(articles, days_back)
+            filtered_articles = self._filter_by_date(articles, days_back, now_iso)
             return filtered_articles[: self.max_articles]
 
         except Exception as e:
@@ -498,22 +861,19 @@ class TavilyTool(BaseSearchTool):
         else:
             return ""  # 不限制时间
 
-    def _extract_published_time(self, result: dict) -> str:
+    def _extract_published_time(self, result: dict, now_iso: str) -> str:
         """从Tavily搜索结果中提取发布时间"""
         # 检查是否有发布时间信息
-        if "published_date" in result:
+        published_date = result.get("published_date")
+        if published_date:
             try:
                 # 尝试解析Tavily提供的发布时间
-                published_str = result["published_date"]
-                if published_str.endswith("Z"):
-                    published_str = published_str[:-1] + "+00:00"
-                published_time = datetime.fromisoformat(published_str)
-                return published_time.isoformat()
-            except (ValueError, TypeError):
+                return _parse_iso(published_date).isoformat()
+            except (ValueError, TypeError, AttributeError):
                 pass
         
-        # 如果没有发布时间信息，使用当前时间
-        return datetime.now(timezone.utc).isoformat()
+        # 如果没有发布时间信息，使用本次搜索的时间
+        return now_iso
 
 
 class GoogleSearchTool(BaseSearchTool):
@@ -528,8 +888,6 @@ class GoogleSearchTool(BaseSearchTool):
     def search(self, query: str, days_back: int = 7) -> List[Article]:
         """使用Google自定义搜索API"""
         try:
-            import requests
-
             params = {
                 "key": self.api_key,
                 "cx": self.search_engine_id,
@@ -539,18 +897,19 @@ class GoogleSearchTool(BaseSearchTool):
                 "sort": "date",
             }
 
-            response = requests.get(self.base_url, params=params, timeout=30)
+            response = self.session.get(self.base_url, params=params, timeout=30)
             response.raise_for_status()
 
             data = response.json()
             articles = []
+            now_iso = datetime.now(timezone.utc).isoformat()
 
             for item in data.get("items", []):
                 article = Article(
                     title=item.get("title", ""),
                     url=item.get("link", ""),
                     summary=item.get("snippet", ""),
-                    published=datetime.now(timezone.utc).isoformat(),  # Google API不总是提供日期
+                    published=now_iso,  # Google API不总是提供日期
                     author="Google Search",
                     source_name=item.get("displayLink", ""),
                     source="google_search",
@@ -575,33 +934,25 @@ class SerperTool(BaseSearchTool):
     def search(self, query: str, days_back: int = 7) -> List[Article]:
         """使用Serper API搜索，添加客户端时间过滤"""
         try:
-            import requests
-
-            # 获取更多结果用于客户端过滤
-            payload = {"q": query, "num": min(self.max_articles * 3, 30)}
+            # 只请求需要的条数：Serper结果没有发布时间，客户端过滤不会丢弃任何结果，多取的部分只会被截掉
+            payload = {"q": query, "num": min(self.max_articles, 100)}
 
             headers = {"X-API-KEY": self.api_key, "Content-Type": "application/json"}
 
-            response = requests.post(self.base_url, json=payload, headers=headers, timeout=30)
+            response = self.session.post(self.base_url, json=payload, headers=headers, timeout=30)
             response.raise_for_status()
 
             data = response.json()
             articles = []
+            now_iso = datetime.now(timezone.utc).isoformat()
 
             for result in data.get("organic", []):
                 # 从 URL 提取域名作为 source_name
                 url = result.get("link", "")
-                source_name = ""
-                if url:
-                    try:
-                        from urllib.parse import urlparse
-
-                        source_name = urlparse(url).netloc or ""
-                    except Exception:
-                        source_name = ""
+                source_name = _netloc(url)
 
                 # 尝试从结果中提取发布时间
-                published_time = self._extract_published_time(result)
+                published_time = self._extract_published_time(result, now_iso)
 
                 article = Article(
                     title=result.get("title", ""),
@@ -615,18 +966,18 @@ class SerperTool(BaseSearchTool):
                 articles.append(article)
 
             # 应用客户端时间过滤
-            filtered_articles = self._filter_by_date(articles, days_back)
+            filtered_articles = self._filter_by_date(articles, days_back, now_iso)
             return filtered_articles[: self.max_articles]
 
         except Exception as e:
             logger.error(f"Serper search failed: {e}")
             return []
 
-    def _extract_published_time(self, result: dict) -> str:
+    def _extract_published_time(self, result: dict, now_iso: str) -> str:
         """从Serper搜索结果中提取发布时间"""
         # Serper API通常不直接提供发布时间，使用当前时间作为默认值
         # 实际应用中可能需要进一步解析页面内容获取真实发布时间
-        return datetime.now(timezone.utc).isoformat()
+        return now_iso
 
 
 class BraveSearchTool(BaseSearchTool):
@@ -640,8 +991,6 @@ class BraveSearchTool(BaseSearchTool):
     def search(self, query: str, days_back: int = 7) -> List[Article]:
         """使用Brave搜索API，支持时间过滤"""
         try:
-            import requests
-
             # 根据days_back设置freshness参数
             freshness = self._get_freshness_param(days_back)
             
@@ -663,15 +1012,16 @@ class BraveSearchTool(BaseSearchTool):
                 "X-Subscription-Token": self.api_key,
             }
 
-            response = requests.get(self.base_url, params=params, headers=headers, timeout=30)
+            response = self.session.get(self.base_url, params=params, headers=headers, timeout=30)
             response.raise_for_status()
 
             data = response.json()
             articles = []
+            now_iso = datetime.now(timezone.utc).isoformat()
 
             for result in data.get("web", {}).get("results", []):
                 # 尝试从结果中提取发布时间
-                published_time = self._extract_published_time(result)
+                published_time = self._extract_published_time(result, now_iso)
                 
                 article = Article(
                     title=result.get("title", ""),
@@ -679,15 +1029,13 @@ class BraveSearchTool(BaseSearchTool):
                     summary=result.get("description", ""),
                     published=published_time,
                     author="Brave Search",
-                    source_name=(
-                        result.get("url", "").split("/")[2] if result.get("url") else "Brave"
-                    ),
+                    source_name=_netloc(result.get("url", "")) or "Brave",
                     source="brave_search",
                 )
                 articles.append(article)
 
             # 应用客户端时间过滤作为备用
-            filtered_articles = self._filter_by_date(articles, days_back)
+            filtered_articles = self._filter_by_date(articles, days_back, now_iso)
             return filtered_articles[: self.max_articles]
 
         except Exception as e:
@@ -707,11 +1055,11 @@ class BraveSearchTool(BaseSearchTool):
         else:
             return ""  # 不限制时间
 
-    def _extract_published_time(self, result: dict) -> str:
+    def _extract_published_time(self, result: dict, now_iso: str) -> str:
         """从Brave搜索结果中提取发布时间"""
         # Brave API可能不直接提供发布时间，使用当前时间作为默认值
         # 实际应用中可能需要进一步解析页面内容获取真实发布时间
-        return datetime.now(timezone.utc).isoformat()
+        return now_iso
 
 
 class MetaSotaSearchTool(BaseSearchTool):
@@ -721,29 +1069,41 @@ class MetaSotaSearchTool(BaseSearchTool):
 
     """
 
+    # 可能携带发布时间的字段，按优先级排列
+    _DATE_FIELDS = ("published_date", "date", "created_at", "pub_date", "publish_date")
+
     def __init__(self, api_key: str, max_articles: int = 10):
         super().__init__(max_articles)
         self.api_key = api_key
         # 正确的MCP服务器端点
         self.mcp_base_url = "https://metaso.cn/api/mcp"
+        # 请求头和请求体中不随查询变化的部分只构造一次
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+            "User-Agent": "AI-News-Collector/1.0",
+            "Accept": "application/json",
+            # 显式请求压缩传输；只列出 urllib3 能解码的编码（安装 brotli 时包含 br）
+            "Accept-Encoding": ACCEPT_ENCODING,
+        }
+        # MCP协议请求格式 - 使用正确的工具名称和参数
+        self._request_envelope = {"jsonrpc": "2.0", "method": "tools/call"}
+        self._search_arguments = {
+            "scope": "webpage",
+            "includeSummary": True,
+            "includeRawContent": False,
+        }
         self.is_available = False
-        self._test_mcp_connection()
+        # 连接检测推迟到首次搜索时执行，避免创建工具时阻塞（最长10秒）
+        self._probed = False
 
     def _test_mcp_connection(self):
         """测试MCP服务器连接"""
         try:
-            import requests
-
-            # 使用正确的认证头测试MCP服务器
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json",
-                "User-Agent": "AI-News-Collector/1.0",
-                "Accept": "application/json",
-            }
-
-            # 测试MCP服务器健康状态
-            response = requests.get(self.mcp_base_url, headers=headers, timeout=10)
+            # 使用正确的认证头测试MCP服务器健康状态
+            response = self.session.get(
+                self.mcp_base_url, headers=self._headers, timeout=10
+            )
             if response.status_code == 200:
                 # 检查响应是否为JSON
                 content_type = response.headers.get("content-type", "")
@@ -765,8 +1125,99 @@ class MetaSotaSearchTool(BaseSearchTool):
         except Exception as e:
             logger.warning(f"MetaSota MCP服务器连接失败: {e}")
 
-    def search(self, query: str, days_back: int = 7) -> List[Article]:
-        """使用MetaSota MCP服务器搜索"""
+    def _build_mcp_request(self, query: str, request_id: int = 1) -> Dict:
+        """构造 metaso_web_search 的 JSON-RPC 请求体，只填充随调用变化的字段"""
+        return {
+            **self._request_envelope,
+            "id": request_id,
+            "params": {
+                "name": "metaso_web_search",
+                "arguments": {
+                    **self._search_arguments,
+                    "q": query,
+                    "size": self.max_articles,
+                },
+            },
+        }
+
+    def _articles_from_mcp_response(self, data: Dict, days_back: int) -> List[Article]:
+        """将MCP响应转换为文章列表并应用客户端时间过滤"""
+        # 响应可能很大，用 %s 延迟格式化，只在 DEBUG 级别启用时才生成字符串
+        logger.debug("MetaSota MCP响应: %s", data)
+
+        # 解析MetaSota MCP响应格式
+        if "result" in data and "content" in data["result"]:
+            content = data["result"]["content"]
+            if content and isinstance(content, list) and len(content) > 0:
+                # MetaSota返回的是JSON字符串，需要解析
+                try:
+                    json_str = content[0].get("text", "")
+                    if json_str:
+                        parsed_data = _json_loads(json_str)
+                        # 提取webpages数组
+                        results = parsed_data.get("webpages", [])
+                    else:
+                        results = []
+                except (json.JSONDecodeError, KeyError) as e:
+                    logger.warning(f"MetaSota响应解析失败: {e}")
+                    results = []
+            else:
+                results = []
+        elif "result" in data:
+            results = data["result"] if isinstance(data["result"], list) else []
+        else:
+            results = data.get("data", [])
+
+        now = datetime.now(timezone.utc)
+        now_iso = now.isoformat()
+        # days_back<=0 表示不过滤
+        cutoff_ts = None
+        min_date = None
+        if days_back > 0:
+            cutoff_ts = (now - timedelta(days=days_back)).timestamp()
+            # 范围内可能出现的最早日期（多留一天，容纳带时区偏移的本地日期）
+            min_date = (now - timedelta(days=days_back + 1)).date().isoformat()
+
+        def iter_articles():
+            for result in results:
+                if not isinstance(result, dict):
+                    continue
+                # 尝试从结果中提取发布时间，日期明显过期的返回None
+                published_time = self._extract_published_time(result, now_iso, min_date)
+                if published_time is None:
+                    continue
+                # 先做客户端时间过滤，超出范围的结果不构造Article；
+                # 占位的本次搜索时间必然在范围内，缺失或无法解析的时间（NaN）被跳过
+                if (
+                    cutoff_ts is not None
+                    and published_time != now_iso
+                    and not _published_timestamp(published_time) >= cutoff_ts
+                ):
+                    continue
+
+                yield Article(
+                    title=_first(result, ("title", "headline", "name")),
+                    url=_first(result, ("link", "url", "href")),
+                    summary=_first(
+                        result, ("snippet", "summary", "description", "content", "abstract")
+                    ),
+                    published=published_time,
+                    author=_first(result, ("authors", "author", "creator"), "MetaSota Search"),
+                    source_name=_first(result, ("source", "domain", "site"), "MetaSota"),
+                    source="metasota_search",
+                )
+
+        # 凑满 max_articles 即停止
+        filtered_articles = list(islice(iter_articles(), self.max_articles))
+        logger.info(f"MetaSota搜索返回 {len(filtered_articles)} 篇文章（过滤后）")
+        return filtered_articles
+
+    def _check_available(self) -> bool:
+        """首次调用时检测连接，不可用时输出排查建议"""
+        if not self._probed:
+            self._test_mcp_connection()
+            self._probed = True
+
         if not self.is_available:
             logger.warning("MetaSota MCP服务器不可用，跳过搜索")
             logger.info("MetaSota搜索问题分析:")
@@ -774,142 +1225,220 @@ class MetaSotaSearchTool(BaseSearchTool):
             logger.info("2. 可能需要WebSocket连接或特殊MCP客户端")
             logger.info("3. 可能需要特殊的认证或配置")
             logger.info("建议: 联系ModelScope技术支持获取正确的MCP服务器使用方法")
+        return self.is_available
+
+    def search(self, query: str, days_back: int = 7) -> List[Article]:
+        """使用MetaSota MCP服务器搜索"""
+        if not self._check_available():
             return []
 
         try:
-            import requests
-            import json
-            from datetime import datetime, timedelta
-
-            # MCP协议请求格式 - 使用正确的工具名称和参数
-            mcp_request = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "tools/call",
-                "params": {
-                    "name": "metaso_web_search",
-                    "arguments": {
-                        "q": query,
-                        "size": self.max_articles,
-                        "scope": "webpage",
-                        "includeSummary": True,
-                        "includeRawContent": False,
-                    },
-                },
-            }
-
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json",
-                "User-Agent": "AI-News-Collector/1.0",
-                "Accept": "application/json",
-            }
-
             logger.info(f"调用MetaSota MCP服务器: {query}")
-            response = requests.post(
-                self.mcp_base_url, json=mcp_request, headers=headers, timeout=30
+            response = self.session.post(
+                self.mcp_base_url,
+                json=self._build_mcp_request(query),
+                headers=self._headers,
+                timeout=30,
             )
 
             if response.status_code == 200:
                 try:
-                    data = response.json()
-                    logger.info(f"MetaSota MCP响应: {data}")
-
-                    # 解析MetaSota MCP响应格式
-                    if "result" in data and "content" in data["result"]:
-                        content = data["result"]["content"]
-                        if content and isinstance(content, list) and len(content) > 0:
-                            # MetaSota返回的是JSON字符串，需要解析
-                            try:
-                                json_str = content[0].get("text", "")
-                                if json_str:
-                                    parsed_data = json.loads(json_str)
-                                    # 提取webpages数组
-                                    results = parsed_data.get("webpages", [])
-                                else:
-                                    results = []
-                            except (json.JSONDecodeError, KeyError) as e:
-                                logger.warning(f"MetaSota响应解析失败: {e}")
-                                results = []
-                        else:
-                            results = []
-                    elif "result" in data:
-                        results = data["result"] if isinstance(data["result"], list) else []
-                    else:
-                        results = data.get("data", [])
-
-                    articles = []
-                    for result in results:
-                        if isinstance(result, dict):
-                            # 尝试从结果中提取发布时间
-                            published_time = self._extract_published_time(result)
-                            
-                            article = Article(
-                                title=result.get(
-                                    "title", result.get("headline", result.get("name", ""))
-                                ),
-                                url=result.get(
-                                    "link", result.get("url", result.get("href", ""))
-                                ),
-                                summary=result.get(
-                                    "snippet",
-                                    result.get(
-                                        "summary",
-                                        result.get(
-                                            "description",
-                                            result.get("content", result.get("abstract", "")),
-                                        ),
-                                    ),
-                                ),
-                                published=published_time,
-                                author=result.get(
-                                    "authors",
-                                    result.get(
-                                        "author", result.get("creator", "MetaSota Search")
-                                    ),
-                                ),
-                                source_name=result.get(
-                                    "source",
-                                    result.get("domain", result.get("site", "MetaSota")),
-                                ),
-                                source="metasota_search",
-                            )
-                            articles.append(article)
-
-                    # 应用客户端时间过滤
-                    filtered_articles = self._filter_by_date(articles, days_back)
-                    logger.info(f"MetaSota搜索返回 {len(filtered_articles)} 篇文章（过滤后）")
-                    return filtered_articles[: self.max_articles]
+                    data = _decode_json(response)
+                    return self._articles_from_mcp_response(data, days_back)
 
                 except json.JSONDecodeError as e:
                     logger.error(f"MetaSota MCP响应JSON解析失败: {e}")
-                    logger.debug(f"原始响应: {response.text[:500]}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        # 只解码需要的前缀，避免为日志解码整个响应体
+                        logger.debug(
+                            f"原始响应: {response.content[:500].decode('utf-8', 'replace')}"
+                        )
                     return []
             else:
-                logger.error(
-                    f"MetaSota MCP服务器错误: {response.status_code} - {response.text[:200]}"
-                )
+                if logger.isEnabledFor(logging.ERROR):
+                    logger.error(
+                        f"MetaSota MCP服务器错误: {response.status_code} - "
+                        f"{response.content[:200].decode('utf-8', 'replace')}"
+                    )
                 return []
 
         except Exception as e:
             logger.error(f"MetaSota MCP搜索失败: {e}")
             return []
 
-    def _extract_published_time(self, result: dict) -> str:
-        """从MetaSota搜索结果中提取发布时间"""
-        # 尝试从多个可能的字段中提取发布时间
-        date_fields = ["published_date", "date", "created_at", "pub_date", "publish_date"]
-        
-        for field in date_fields:
-            if result.get(field):
+    def search_many(self, queries: Sequence[str], days_back: int = 7) -> List[List[Article]]:
+        """
+        批量搜索：将多个查询合并为一个 JSON-RPC 批量请求，只发一次 POST
+
+        返回与 queries 顺序一致的文章列表；服务器不支持批量请求时逐个调用 search。
+        """
+        queries = list(queries)
+        if len(queries) <= 1:
+            return [self.search(query, days_back) for query in queries]
+        if not self._check_available():
+            return [[] for _ in queries]
+
+        try:
+            logger.info(f"批量调用MetaSota MCP服务器: {len(queries)} 个查询")
+            response = self.session.post(
+                self.mcp_base_url,
+                json=[self._build_mcp_request(query, i) for i, query in enumerate(queries)],
+                headers=self._headers,
+                timeout=30,
+            )
+            data = _decode_json(response) if response.status_code == 200 else None
+        except Exception as e:
+            logger.warning(f"MetaSota批量请求失败: {e}")
+            data = None
+
+        if not isinstance(data, list):
+            logger.warning("MetaSota MCP服务器不支持批量请求，改为逐个查询")
+            return [self.search(query, days_back) for query in queries]
+
+        # 按 id 拆分响应，批量响应的顺序不保证与请求一致
+        by_id = {item.get("id"): item for item in data if isinstance(item, dict)}
+        return [
+            self._articles_from_mcp_response(by_id[i], days_back) if i in by_id else []
+            for i in range(len(queries))
+        ]
+
+    async def search_async(self, query: str, days_back: int = 7) -> List[Article]:
+        """
+        异步搜索：在事件循环内直接发起请求，多个调用可真正并发
+
+        每次调用使用独立的 aiohttp 会话并在返回前关闭，调用方无需负责清理；
+        未安装 aiohttp 时退回到线程池执行同步的 search。
+        """
+        if aiohttp is None:
+            return await asyncio.to_thread(self.search, query, days_back)
+
+        if not self._probed and not await asyncio.to_thread(self._check_available):
+            return []
+        if not self.is_available:
+            return []
+
+        try:
+            logger.info(f"调用MetaSota MCP服务器: {query}")
+            async with aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=30)
+            ) as session:
+                async with session.post(
+                    self.mcp_base_url,
+                    json=self._build_mcp_request(query),
+                    headers=self._headers,
+                ) as response:
+                    body = await response.read()
+                    if response.status != 200:
+                        logger.error(
+                            f"MetaSota MCP服务器错误: {response.status} - "
+                            f"{body[:200].decode('utf-8', 'replace')}"
+                        )
+                        return []
+
+            try:
+                data = _json_loads(body)
+            except ValueError as e:
+                logger.error(f"MetaSota MCP响应JSON解析失败: {e}")
+                return []
+            return self._articles_from_mcp_response(data, days_back)
+
+        except Exception as e:
+            logger.error(f"MetaSota MCP搜索失败: {e}")
+            return []
+
+    def _extract_published_time(
+        self, result: dict, now_iso: str, min_date: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        从MetaSota搜索结果中提取发布时间
+
+        给出 min_date（YYYY-MM-DD）时，以早于它的日期开头的字段无需解析，直接尝试下一个字段；
+        没有可用字段且出现过这类过期日期时返回None表示已过期。
+        """
+        stale = False
+        # 尝试从多个可能的字段中提取发布时间，每个字段只查一次字典
+        for field in self._DATE_FIELDS:
+            value = result.get(field)
+            if value:
+                if (
+                    min_date is not None
+                    and isinstance(value, str)
+                    and value[4:5] == "-"
+                    and value[7:8] == "-"
+                    and value[:10] < min_date
+                ):
+                    stale = True
+                    continue
                 try:
-                    date_str = result[field]
-                    if date_str.endswith("Z"):
-                        date_str = date_str[:-1] + "+00:00"
-                    published_time = datetime.fromisoformat(date_str)
-                    return published_time.isoformat()
-                except (ValueError, TypeError):
+                    return _parse_iso(value).isoformat()
+                except (ValueError, TypeError, AttributeError):
                     continue
         
-        # 如果没有找到有效的发布时间，使用当前时间
-        return datetime.now(timezone.utc).isoformat()
+        # 如果没有找到有效的发布时间，使用本次搜索的时间
+        return None if stale else now_iso
+
+
+class MultiSourceSearch:
+    """
+    多源并发搜索
+
+    用线程池同时调用多个搜索工具，总耗时约为最慢来源的耗时而不是各来源耗时之和。
+    单个来源失败或超时不会影响其他来源的结果。
+    """
+
+    def __init__(self, tools: Sequence[BaseSearchTool], timeout: Optional[float] = 60):
+        """
+        Args:
+            tools: 搜索工具列表
+            timeout: 等待所有来源的总超时秒数，None表示不限制
+        """
+        self.tools = list(tools)
+        self.timeout = timeout
+
+    def search(self, query: str, days_back: int = 7) -> List[Article]:
+        """并发搜索所有来源，按工具顺序合并结果"""
+        articles: List[Article] = []
+        for result in self._search_all(query, days_back):
+            if result:
+                articles.extend(result)
+        return articles
+
+    def search_by_tool(self, query: str, days_back: int = 7) -> Dict[str, List[Article]]:
+        """并发搜索所有来源，返回 工具名 -> 文章列表（失败或超时的来源不在结果中）"""
+        return {
+            tool.name: result
+            for tool, result in zip(self.tools, self._search_all(query, days_back))
+            if result is not None
+        }
+
+    def _search_all(self, query: str, days_back: int) -> List[Optional[List[Article]]]:
+        """并发执行搜索，按工具顺序返回结果，失败或超时的来源为None"""
+        results: List[Optional[List[Article]]] = [None] * len(self.tools)
+        if not self.tools:
+            return results
+
+        pool = ThreadPoolExecutor(max_workers=len(self.tools))
+        try:
+            futures = {
+                pool.submit(tool.search, query, days_back): index
+                for index, tool in enumerate(self.tools)
+            }
+            try:
+                for future in as_completed(futures, timeout=self.timeout):
+                    index = futures[future]
+                    try:
+                        results[index] = future.result()
+                    except Exception as e:
+                        logger.error(f"{self.tools[index].name} 搜索失败: {e}")
+            except FutureTimeoutError:
+                pending = [
+                    self.tools[index].name
+                    for future, index in futures.items()
+                    if not future.done()
+                ]
+                logger.warning(f"多源搜索超时，未完成的来源: {', '.join(pending)}")
+        finally:
+            # 不等待超时的来源；各工具的请求自身带有 timeout，线程最终会退出
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        return results
@@ -5,6 +5,7 @@
 
 import json
 import logging
+from collections import Counter
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from pathlib import Path
@@ -220,12 +221,11 @@ class ReportGenerator:
         avg_reading_time = sum(r.get("average_reading_time", 0) for r in results) / len(results)
 
         # 统计各源使用情况
-        source_stats = {}
-        for result in results:
-            articles = result.get("articles", [])
-            for article in articles:
-                source = article.get("source", "unknown")
-                source_stats[source] = source_stats.get(source, 0) + 1
+        source_stats = Counter(
+            article.get("source", "unknown")
+            for result in results
+            for article in result.get("articles", [])
+        )
 
         # 生成汇总报告
         report = f"""# AI信息搜集周报
@@ -239,7 +239,7 @@ class ReportGenerator:
 ## 📈 各源使用情况
 """
 
-        for source, count in sorted(source_stats.items(), key=lambda x: x[1], reverse=True):
+        for source, count in source_stats.most_common():
             report += f"- **{source}**: {count} 篇文章\n"
 
         report += f"""
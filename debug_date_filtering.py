@@ -8,20 +8,25 @@ import asyncio
 import logging
 from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Any
-import sys
-import os
-
-# 添加项目路径
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'ai_news_collector_lib'))
 
 from ai_news_collector_lib.config.settings import SearchConfig
 from ai_news_collector_lib.core.collector import AINewsCollector
 from ai_news_collector_lib.models.article import Article
+from ai_news_collector_lib.tools.search_tools import _iso_to_ts
+
+try:
+    import numpy as np
+except ImportError:  # NumPy 为可选依赖，缺失时退回纯 Python 计算
+    np = None
 
 # 设置日志
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# test_all_sources 同时测试的搜索源上限
+MAX_CONCURRENT_SOURCES = 8
+
+
 class DateFilteringDiagnostic:
     """时间过滤诊断工具"""
     
@@ -86,8 +91,8 @@ class DateFilteringDiagnostic:
     
     def check_article_dates(self, articles: List[Article], days_back: int) -> Dict[str, Any]:
         """检查文章日期是否符合要求"""
-        now = datetime.now(timezone.utc)
-        cutoff_date = now - timedelta(days=days_back)
+        now_ts = datetime.now(timezone.utc).timestamp()
+        cutoff_ts = now_ts - timedelta(days=days_back).total_seconds()
         
         results = {
             "total_articles": len(articles),
@@ -95,44 +100,58 @@ class DateFilteringDiagnostic:
             "outside_date_range": 0,
             "invalid_dates": 0,
             "old_articles": [],
-            "date_analysis": []
+            "date_analysis": {"source": [], "published": [], "is_recent": [], "days_old": []}
         }
         
+        # 第一遍：逐条解析时间（解析本身无法向量化），无效日期直接计数
+        valid_articles = []
+        timestamps = []
         for article in articles:
+            if not article.published:
+                results["invalid_dates"] += 1
+                continue
             try:
-                if not article.published:
-                    results["invalid_dates"] += 1
-                    continue
-                
-                # 处理不同的时间格式
-                published_str = article.published
-                if published_str.endswith("Z"):
-                    published_str = published_str[:-1] + "+00:00"
-                
-                published_time = datetime.fromisoformat(published_str)
-                
-                if published_time >= cutoff_date:
-                    results["within_date_range"] += 1
-                else:
-                    results["outside_date_range"] += 1
-                    days_old = (now - published_time).days
-                    results["old_articles"].append({
-                        "title": article.title[:50] + "..." if len(article.title) > 50 else article.title,
-                        "source": article.source,
-                        "published": article.published,
-                        "days_old": days_old
-                    })
-                
-                results["date_analysis"].append({
-                    "source": article.source,
-                    "published": article.published,
-                    "is_recent": published_time >= cutoff_date,
-                    "days_old": (now - published_time).days if published_time < now else 0
-                })
-                
+                timestamps.append(_iso_to_ts(article.published))
             except (ValueError, TypeError) as e:
                 results["invalid_dates"] += 1
                 logger.warning(f"无法解析日期: {article.published} - {e}")
+                continue
+            valid_articles.append(article)
+        
+        # 第二遍：截止时间比较与天数计算，NumPy 可用时整体向量化
+        if np is not None:
+            ts = np.fromiter(timestamps, dtype=np.float64, count=len(timestamps))
+            is_recent = ts >= cutoff_ts
+            days_old = ((now_ts - ts) // 86400).astype(np.int64)
+            within = int(is_recent.sum())
+            is_recent = is_recent.tolist()
+            days_old = days_old.tolist()
+        else:
+            is_recent = [published_ts >= cutoff_ts for published_ts in timestamps]
+            days_old = [int((now_ts - published_ts) // 86400) for published_ts in timestamps]
+            within = sum(is_recent)
+        
+        results["within_date_range"] = within
+        results["outside_date_range"] = len(valid_articles) - within
+        
+        for article, recent, days in zip(valid_articles, is_recent, days_old):
+            if not recent:
+                title = article.title
+                results["old_articles"].append({
+                    "title": title[:50] + "..." if len(title) > 50 else title,
+                    "source": article.source,
+                    "published": article.published,
+                    "days_old": days
+                })
+        
+        # 按列存储每篇文章的分析结果（各列下标一一对应），避免每篇文章一个字典
+        results["date_analysis"] = {
+            "source": [article.source for article in valid_articles],
+            "published": [article.published for article in valid_articles],
+            "is_recent": is_recent,
+            # 未来时间（时钟偏差）按 0 天计
+            "days_old": [max(days, 0) for days in days_old]
+        }
         
         return results
     
@@ -146,8 +165,12 @@ class DateFilteringDiagnostic:
             if not tool:
                 return {"error": f"搜索源 {source} 不可用"}
             
-            # 执行搜索
-            articles = await asyncio.to_thread(tool.search, query, days_back)
+            # 执行搜索：提供异步接口的工具直接在事件循环内执行，其余转移到线程池
+            search_async = getattr(tool, "search_async", None)
+            if search_async is not None:
+                articles = await search_async(query, days_back)
+            else:
+                articles = await asyncio.to_thread(tool.search, query, days_back)
             
             # 分析结果
             date_analysis = self.check_article_dates(articles, days_back)
@@ -176,11 +199,14 @@ class DateFilteringDiagnostic:
         
         results = {}
         
-        # 并发测试所有源
-        tasks = []
-        for source in available_sources:
-            task = self.test_single_source(source, query, days_back)
-            tasks.append(task)
+        # 并发测试所有源，用信号量限制同时进行的搜索数（同步工具各占一个线程池线程）
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SOURCES)
+        
+        async def test_with_limit(source: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.test_single_source(source, query, days_back)
+        
+        tasks = [test_with_limit(source) for source in available_sources]
         
         if tasks:
             test_results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -277,6 +303,7 @@ class DateFilteringDiagnostic:
         
         return "\n".join(report)
 
+
 async def main():
     """主函数"""
     diagnostic = DateFilteringDiagnostic()
@@ -4,56 +4,45 @@
 为没有实现时间过滤的搜索引擎添加客户端时间过滤
 """
 
-import os
-import sys
 from datetime import datetime, timedelta, timezone
-from typing import List
-
-# 添加项目路径
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'ai_news_collector_lib'))
+from itertools import islice
+from typing import Iterable, List, Optional
 
 from ai_news_collector_lib.models.article import Article
+from ai_news_collector_lib.tools.search_tools import _published_timestamp
+
 
-def apply_client_side_date_filter(articles: List[Article], days_back: int) -> List[Article]:
+def apply_client_side_date_filter(
+    articles: Iterable[Article], days_back: int, limit: Optional[int] = None
+) -> List[Article]:
     """
     在客户端应用时间过滤
     
     Args:
-        articles: 文章列表
+        articles: 文章列表（可以是生成器，按需逐条构造）
         days_back: 天数限制
+        limit: 最多保留的文章数，凑满后不再消费剩余文章
         
     Returns:
         过滤后的文章列表
     """
     if days_back <= 0:
-        return articles
+        return list(islice(articles, limit))
     
-    cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_back)
+    # 截止时间预先转为时间戳，循环内只做浮点数比较
+    cutoff_ts = (datetime.now(timezone.utc) - timedelta(days=days_back)).timestamp()
     filtered_articles = []
     
     for article in articles:
-        try:
-            if not article.published:
-                # 如果没有发布时间，跳过
-                continue
-            
-            # 处理不同的时间格式
-            published_str = article.published
-            if published_str.endswith("Z"):
-                published_str = published_str[:-1] + "+00:00"
-            
-            published_time = datetime.fromisoformat(published_str)
-            
-            # 只保留在时间范围内的文章
-            if published_time >= cutoff_date:
-                filtered_articles.append(article)
-                
-        except (ValueError, TypeError):
-            # 如果时间解析失败，跳过该文章
-            continue
+        # 缺失或无法解析的发布时间得到 NaN，比较结果为 False，文章被跳过
+        if _published_timestamp(article.published) >= cutoff_ts:
+            filtered_articles.append(article)
+            if limit is not None and len(filtered_articles) >= limit:
+                break
     
     return filtered_articles
 
+
 def create_enhanced_search_tools():
     """
     创建增强的搜索工具类，添加客户端时间过滤
@@ -68,53 +57,66 @@ def create_enhanced_search_tools():
 import requests
 import logging
 import json
-from typing import List, Optional
+from typing import Iterable, List, Optional
 from datetime import datetime, timedelta, timezone
 from bs4 import BeautifulSoup
 import feedparser
-import re
+from itertools import islice
 
 from ..models.article import Article
+from .search_tools import _published_timestamp
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
-def apply_client_side_date_filter(articles: List[Article], days_back: int) -> List[Article]:
+def _decode_json(response: requests.Response):
+    """解码JSON响应，安装了orjson时直接解析原始字节"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+def _domain(url: str) -> str:
+    """提取URL中的域名，只做字符串切分，不做 urlparse 的完整解析"""
+    start = url.find("://")
+    rest = url[start + 3:] if start > 0 else url
+    # 域名在第一个 / ? # 之前结束
+    for sep in "/?#":
+        end = rest.find(sep)
+        if end >= 0:
+            rest = rest[:end]
+    return rest
+
+def apply_client_side_date_filter(
+    articles: Iterable[Article], days_back: int, limit: Optional[int] = None
+) -> List[Article]:
     """
     在客户端应用时间过滤
     
     Args:
-        articles: 文章列表
+        articles: 文章列表（可以是生成器，按需逐条构造）
         days_back: 天数限制
+        limit: 最多保留的文章数，凑满后不再消费剩余文章
         
     Returns:
         过滤后的文章列表
     """
     if days_back <= 0:
-        return articles
+        return list(islice(articles, limit))
     
-    cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_back)
+    # 截止时间预先转为时间戳，循环内只做浮点数比较
+    cutoff_ts = (datetime.now(timezone.utc) - timedelta(days=days_back)).timestamp()
     filtered_articles = []
     
     for article in articles:
-        try:
-            if not article.published:
-                # 如果没有发布时间，跳过
-                continue
-            
-            # 处理不同的时间格式
-            published_str = article.published
-            if published_str.endswith("Z"):
-                published_str = published_str[:-1] + "+00:00"
-            
-            published_time = datetime.fromisoformat(published_str)
-            
-            # 只保留在时间范围内的文章
-            if published_time >= cutoff_date:
-                filtered_articles.append(article)
-                
-        except (ValueError, TypeError):
-            # 如果时间解析失败，跳过该文章
-            continue
+        # 缺失或无法解析的发布时间得到 NaN，比较结果为 False，文章被跳过
+        if _published_timestamp(article.published) >= cutoff_ts:
+            filtered_articles.append(article)
+            if limit is not None and len(filtered_articles) >= limit:
+                break
     
     return filtered_articles
 
@@ -131,8 +133,6 @@ class EnhancedSerperTool:
     def search(self, query: str, days_back: int = 7) -> List[Article]:
         """使用Serper API搜索，带客户端时间过滤"""
         try:
-            import requests
-
             payload = {"q": query, "num": min(self.max_articles * 3, 30)}  # 获取更多结果用于过滤
 
             headers = {"X-API-KEY": self.api_key, "Content-Type": "application/json"}
@@ -140,34 +140,29 @@ class EnhancedSerperTool:
             response = requests.post(self.base_url, json=payload, headers=headers, timeout=30)
             response.raise_for_status()
 
-            data = response.json()
-            articles = []
-
-            for result in data.get("organic", []):
-                # 从 URL 提取域名作为 source_name
-                url = result.get("link", "")
-                source_name = ""
-                if url:
-                    try:
-                        from urllib.parse import urlparse
-                        source_name = urlparse(url).netloc or ""
-                    except Exception:
-                        source_name = ""
-
-                article = Article(
-                    title=result.get("title", ""),
-                    url=url,
-                    summary=result.get("snippet", ""),
-                    published=datetime.now(timezone.utc).isoformat(),
-                    author="Serper Search",
-                    source_name=source_name,
-                    source="serper",
-                )
-                articles.append(article)
-
-            # 应用客户端时间过滤
-            filtered_articles = apply_client_side_date_filter(articles, days_back)
-            return filtered_articles[:self.max_articles]
+            data = _decode_json(response)
+            # 结果不带发布时间，统一使用本次搜索的时间
+            now_iso = datetime.now(timezone.utc).isoformat()
+
+            def iter_articles():
+                for result in data.get("organic", []):
+                    # 从 URL 提取域名作为 source_name
+                    url = result.get("link", "")
+                    source_name = _domain(url)
+
+                    article = Article(
+                        title=result.get("title", ""),
+                        url=url,
+                        summary=result.get("snippet", ""),
+                        published=now_iso,
+                        author="Serper Search",
+                        source_name=source_name,
+                        source="serper",
+                    )
+                    yield article
+
+            # 应用客户端时间过滤：文章按需构造，凑满 max_articles 即停止
+            return apply_client_side_date_filter(iter_articles(), days_back, self.max_articles)
 
         except Exception as e:
             logger.error(f"Enhanced Serper search failed: {e}")
@@ -186,8 +181,6 @@ class EnhancedBraveSearchTool:
     def search(self, query: str, days_back: int = 7) -> List[Article]:
         """使用Brave搜索API，带客户端时间过滤"""
         try:
-            import requests
-
             params = {
                 "q": query,
                 "count": min(self.max_articles * 3, 60),  # 获取更多结果用于过滤
@@ -205,26 +198,25 @@ class EnhancedBraveSearchTool:
             response = requests.get(self.base_url, params=params, headers=headers, timeout=30)
             response.raise_for_status()
 
-            data = response.json()
-            articles = []
-
-            for result in data.get("web", {}).get("results", []):
-                article = Article(
-                    title=result.get("title", ""),
-                    url=result.get("url", ""),
-                    summary=result.get("description", ""),
-                    published=datetime.now(timezone.utc).isoformat(),
-                    author="Brave Search",
-                    source_name=(
-                        result.get("url", "").split("/")[2] if result.get("url") else "Brave"
-                    ),
-                    source="brave_search",
-                )
-                articles.append(article)
-
-            # 应用客户端时间过滤
-            filtered_articles = apply_client_side_date_filter(articles, days_back)
-            return filtered_articles[:self.max_articles]
+            data = _decode_json(response)
+            # 结果不带发布时间，统一使用本次搜索的时间
+            now_iso = datetime.now(timezone.utc).isoformat()
+
+            def iter_articles():
+                for result in data.get("web", {}).get("results", []):
+                    article = Article(
+                        title=result.get("title", ""),
+                        url=result.get("url", ""),
+                        summary=result.get("description", ""),
+                        published=now_iso,
+                        author="Brave Search",
+                        source_name=_domain(result.get("url", "")) or "Brave",
+                        source="brave_search",
+                    )
+                    yield article
+
+            # 应用客户端时间过滤：文章按需构造，凑满 max_articles 即停止
+            return apply_client_side_date_filter(iter_articles(), days_back, self.max_articles)
 
         except Exception as e:
             logger.error(f"Enhanced Brave search failed: {e}")
@@ -243,8 +235,6 @@ class EnhancedTavilyTool:
     def search(self, query: str, days_back: int = 7) -> List[Article]:
         """使用Tavily API搜索，带客户端时间过滤"""
         try:
-            import requests
-
             payload = {
                 "api_key": self.api_key,
                 "query": query,
@@ -264,24 +254,25 @@ class EnhancedTavilyTool:
             )
             response.raise_for_status()
 
-            data = response.json()
-            articles = []
-
-            for result in data.get("results", []):
-                article = Article(
-                    title=result.get("title", ""),
-                    url=result.get("url", ""),
-                    summary=result.get("content", ""),
-                    published=datetime.now(timezone.utc).isoformat(),
-                    author="Tavily Search",
-                    source_name=result.get("url", "").split("/")[2] if result.get("url") else "Tavily",
-                    source="tavily",
-                )
-                articles.append(article)
-
-            # 应用客户端时间过滤
-            filtered_articles = apply_client_side_date_filter(articles, days_back)
-            return filtered_articles[:self.max_articles]
+            data = _decode_json(response)
+            # 结果不带发布时间，统一使用本次搜索的时间
+            now_iso = datetime.now(timezone.utc).isoformat()
+
+            def iter_articles():
+                for result in data.get("results", []):
+                    article = Article(
+                        title=result.get("title", ""),
+                        url=result.get("url", ""),
+                        summary=result.get("content", ""),
+                        published=now_iso,
+                        author="Tavily Search",
+                        source_name=_domain(result.get("url", "")) or "Tavily",
+                        source="tavily",
+                    )
+                    yield article
+
+            # 应用客户端时间过滤：文章按需构造，凑满 max_articles 即停止
+            return apply_client_side_date_filter(iter_articles(), days_back, self.max_articles)
 
         except Exception as e:
             logger.error(f"Enhanced Tavily search failed: {e}")
@@ -290,6 +281,7 @@ class EnhancedTavilyTool:
     
     return enhanced_tools_code
 
+
 def main():
     """主函数"""
     print("时间过滤问题修复方案")
@@ -337,5 +329,6 @@ def main():
     print("已创建增强的搜索工具代码: enhanced_search_tools.py")
     print("可以将这些代码集成到原始项目中")
 
+
 if __name__ == "__main__":
     main()
@@ -63,6 +63,11 @@ setup(
             "redis>=4.0.0",
             "schedule>=1.2.0",
             "apscheduler>=3.9.0",
+            "datasketch>=1.5.0",
+            "rapidfuzz>=2.0.0",
+            "selectolax>=0.3.0",
+            "orjson>=3.8.0",
+            "requests-cache>=1.0.0",
         ],
         "nlp": [
             "nltk>=3.8",
@@ -78,6 +83,7 @@ setup(
             "pytest>=7.0.0",
             "pytest-asyncio>=0.20.0",
             "pytest-cov>=4.0.0",
+            "pytest-xdist>=3.0.0",
             "black>=22.0.0",
             "flake8>=5.0.0",
             "mypy>=0.950",
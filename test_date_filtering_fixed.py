@@ -4,35 +4,103 @@
 验证各个搜索引擎的时间过滤是否正常工作
 """
 
+import argparse
 import asyncio
+import json
 import logging
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import List, Dict, Any
-import sys
+from typing import Any, Dict, Iterator, List, Optional
 import os
 
-# 添加项目路径
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'ai_news_collector_lib'))
-
 from ai_news_collector_lib.config.settings import SearchConfig
 from ai_news_collector_lib.core.collector import AINewsCollector
 from ai_news_collector_lib.models.article import Article
+from ai_news_collector_lib.utils.cache import CacheManager
+from ai_news_collector_lib.tools.search_tools import _iso_to_ts
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # 设置日志
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# 搜索结果缓存目录与有效期（小时）
+SEARCH_CACHE_DIR = ".test_cache"
+SEARCH_CACHE_TTL_HOURS = 1
+
+# 日期分布区间：文章天数 <= 边界值时落入对应区间，超过最后一个边界的归入“1年以上”
+_DAYS_OLD_BOUNDS = (1, 7, 30, 365)
+_DAYS_OLD_LABELS = ("0-1天", "1-7天", "7-30天", "30-365天", "1年以上")
+
+
+def _ellipsis(text: str, limit: int = 50) -> str:
+    """超过 limit 个字符时截断并加省略号"""
+    return text if len(text) <= limit else f"{text[:limit]}..."
+
+
+def write_json_report(test_results: Dict[str, Any], path: str) -> None:
+    """将各源的测试结果保存为JSON，安装了orjson时直接写出字节"""
+    if orjson is not None:
+        with open(path, "wb") as f:
+            options = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            f.write(orjson.dumps(test_results, option=options))
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(test_results, f, ensure_ascii=False, indent=2)
+
+
 class DateFilteringTester:
     """时间过滤功能测试器"""
     
-    def __init__(self):
-        self.config = SearchConfig()
-        self.collector = AINewsCollector(self.config)
+    def __init__(
+        self,
+        collector: Optional[AINewsCollector] = None,
+        refresh: bool = False,
+        cache_dir: str = SEARCH_CACHE_DIR,
+    ):
+        """
+        Args:
+            collector: 复用已创建的收集器（如 pytest 会话中的 collector fixture），不传时新建
+            refresh: 为True时忽略已缓存的搜索结果，重新请求并覆盖缓存
+            cache_dir: 搜索结果缓存目录
+        """
+        self.collector = collector or AINewsCollector(SearchConfig())
+        self.config = self.collector.config
+        # 按 (搜索源, 查询, 天数) 缓存搜索结果，重复运行时无需再次请求网络
+        self.cache = CacheManager(cache_dir=cache_dir, default_ttl_hours=SEARCH_CACHE_TTL_HOURS)
+        self.refresh = refresh
+    
+    async def _search_with_cache(
+        self, source: str, tool, query: str, days_back: int
+    ) -> List[Article]:
+        """执行搜索，优先使用未过期的缓存结果"""
+        cache_key = self.cache.get_cache_key(query, [source], days_back=days_back)
+        if not self.refresh:
+            cached = self.cache.get_cached_result(cache_key)
+            if cached is not None:
+                logger.info(f"使用缓存的搜索结果: {source}")
+                return [Article.from_dict(data) for data in cached["articles"]]
+        
+        articles = await asyncio.to_thread(tool.search, query, days_back)
+        self.cache.cache_result(
+            cache_key, {"articles": [article.to_dict() for article in articles]}
+        )
+        return articles
         
-    def analyze_article_dates(self, articles: List[Article], days_back: int) -> Dict[str, Any]:
-        """分析文章日期分布"""
-        now = datetime.now(timezone.utc)
-        cutoff_date = now - timedelta(days=days_back)
+    def analyze_article_dates(
+        self, articles: List[Article], days_back: int, now: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """分析文章日期分布；now 为基准时间，不传时取当前时间"""
+        if now is None:
+            now = datetime.now(timezone.utc)
+        # 截止时间和当前时间预先转为时间戳，循环内只做浮点数运算
+        now_ts = now.timestamp()
+        cutoff_ts = (now - timedelta(days=days_back)).timestamp()
         
         analysis = {
             "total_articles": len(articles),
@@ -45,76 +113,82 @@ class DateFilteringTester:
             "date_issues": []
         }
         
-        valid_articles = []
+        # 单次遍历中记录最老和最新的文章，无需保存并排序全部文章
+        oldest = newest = None
+        # 各日期区间的计数，循环结束后再转换为带标签的字典
+        bucket_counts = [0] * len(_DAYS_OLD_LABELS)
+        # 循环内只更新局部变量，结束后再写回 analysis
+        within_range = outside_range = invalid_dates = 0
+        add_issue = analysis["date_issues"].append
         
         for article in articles:
             try:
                 if not article.published:
-                    analysis["invalid_dates"] += 1
+                    invalid_dates += 1
                     continue
                 
-                # 处理不同的时间格式
-                published_str = article.published
-                if published_str.endswith("Z"):
-                    published_str = published_str[:-1] + "+00:00"
-                
-                published_time = datetime.fromisoformat(published_str)
-                valid_articles.append((article, published_time))
+                # 解析为UTC时间戳（支持Z后缀，naive时间视为UTC）
+                published_ts = _iso_to_ts(article.published)
+                if oldest is None or published_ts < oldest[1]:
+                    oldest = (article, published_ts)
+                if newest is None or published_ts > newest[1]:
+                    newest = (article, published_ts)
                 
                 # 统计日期分布
-                days_old = (now - published_time).days
-                if days_old <= 1:
-                    analysis["date_distribution"]["0-1天"] = analysis["date_distribution"].get("0-1天", 0) + 1
-                elif days_old <= 7:
-                    analysis["date_distribution"]["1-7天"] = analysis["date_distribution"].get("1-7天", 0) + 1
-                elif days_old <= 30:
-                    analysis["date_distribution"]["7-30天"] = analysis["date_distribution"].get("7-30天", 0) + 1
-                elif days_old <= 365:
-                    analysis["date_distribution"]["30-365天"] = analysis["date_distribution"].get("30-365天", 0) + 1
-                else:
-                    analysis["date_distribution"]["1年以上"] = analysis["date_distribution"].get("1年以上", 0) + 1
+                days_old = int((now_ts - published_ts) // 86400)
+                bucket_counts[bisect_left(_DAYS_OLD_BOUNDS, days_old)] += 1
                 
                 # 检查是否在时间范围内
-                if published_time >= cutoff_date:
-                    analysis["within_range"] += 1
+                if published_ts >= cutoff_ts:
+                    within_range += 1
                 else:
-                    analysis["outside_range"] += 1
-                    analysis["date_issues"].append({
-                        "title": article.title[:50] + "..." if len(article.title) > 50 else article.title,
+                    outside_range += 1
+                    add_issue({
+                        "title": _ellipsis(article.title),
                         "source": article.source,
                         "published": article.published,
                         "days_old": days_old
                     })
                 
             except (ValueError, TypeError) as e:
-                analysis["invalid_dates"] += 1
-                analysis["date_issues"].append({
-                    "title": article.title[:50] + "..." if len(article.title) > 50 else article.title,
+                invalid_dates += 1
+                add_issue({
+                    "title": _ellipsis(article.title),
                     "source": article.source,
                     "error": f"日期解析失败: {e}",
                     "published": article.published
                 })
         
-        # 找到最老和最新的文章
-        if valid_articles:
-            valid_articles.sort(key=lambda x: x[1])
-            analysis["oldest_article"] = {
-                "title": valid_articles[-1][0].title[:50] + "..." if len(valid_articles[-1][0].title) > 50 else valid_articles[-1][0].title,
-                "source": valid_articles[-1][0].source,
-                "published": valid_articles[-1][0].published,
-                "days_old": (now - valid_articles[-1][1]).days
-            }
-            analysis["newest_article"] = {
-                "title": valid_articles[0][0].title[:50] + "..." if len(valid_articles[0][0].title) > 50 else valid_articles[0][0].title,
-                "source": valid_articles[0][0].source,
-                "published": valid_articles[0][0].published,
-                "days_old": (now - valid_articles[0][1]).days
+        analysis["within_range"] = within_range
+        analysis["outside_range"] = outside_range
+        analysis["invalid_dates"] = invalid_dates
+        analysis["date_distribution"] = {
+            label: count for label, count in zip(_DAYS_OLD_LABELS, bucket_counts) if count
+        }
+        
+        # 最老和最新的文章
+        def summarize(article: Article, published_ts: float) -> Dict[str, Any]:
+            return {
+                "title": _ellipsis(article.title),
+                "source": article.source,
+                "published": article.published,
+                "days_old": int((now_ts - published_ts) // 86400)
             }
         
+        if oldest is not None:
+            analysis["oldest_article"] = summarize(*oldest)
+            analysis["newest_article"] = summarize(*newest)
+        
         return analysis
     
-    async def test_single_source_detailed(self, source: str, query: str = "artificial intelligence", days_back: int = 1) -> Dict[str, Any]:
-        """详细测试单个搜索源"""
+    async def test_single_source_detailed(
+        self,
+        source: str,
+        query: str = "artificial intelligence",
+        days_back: int = 1,
+        now: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """详细测试单个搜索源；now 为日期分析的基准时间，多个源共用时结果可比"""
         logger.info(f"详细测试搜索源: {source}")
         
         try:
@@ -124,10 +198,10 @@ class DateFilteringTester:
                 return {"error": f"搜索源 {source} 不可用"}
             
             # 执行搜索
-            articles = await asyncio.to_thread(tool.search, query, days_back)
+            articles = await self._search_with_cache(source, tool, query, days_back)
             
             # 分析结果
-            date_analysis = self.analyze_article_dates(articles, days_back)
+            date_analysis = self.analyze_article_dates(articles, days_back, now)
             
             return {
                 "source": source,
@@ -144,25 +218,24 @@ class DateFilteringTester:
             logger.error(f"测试搜索源 {source} 失败: {e}")
             return {"error": str(e)}
     
-    def generate_detailed_report(self, test_results: Dict[str, Any]) -> str:
-        """生成详细的测试报告"""
-        report = []
-        report.append("=" * 80)
-        report.append("AI新闻收集器时间过滤修复验证报告")
-        report.append("=" * 80)
-        report.append("")
+    def iter_detailed_report(self, test_results: Dict[str, Any]) -> Iterator[str]:
+        """逐行生成详细的测试报告，调用方可直接写出而无需先拼接整份报告"""
+        yield "=" * 80
+        yield "AI新闻收集器时间过滤修复验证报告"
+        yield "=" * 80
+        yield ""
         
         total_articles = 0
         total_within_range = 0
         total_outside_range = 0
         problematic_sources = []
         
-        report.append("1. 各搜索源详细测试结果:")
-        report.append("-" * 60)
+        yield "1. 各搜索源详细测试结果:"
+        yield "-" * 60
         
         for source, result in test_results.items():
             if "error" in result:
-                report.append(f"❌ {source}: 错误 - {result['error']}")
+                yield f"❌ {source}: 错误 - {result['error']}"
                 continue
             
             articles_found = result.get("articles_found", 0)
@@ -172,92 +245,126 @@ class DateFilteringTester:
             total_within_range += date_analysis.get("within_range", 0)
             total_outside_range += date_analysis.get("outside_range", 0)
             
-            report.append(f"✅ {source}: 找到 {articles_found} 篇文章")
+            yield f"✅ {source}: 找到 {articles_found} 篇文章"
             
             # 显示日期分布
             date_dist = date_analysis.get("date_distribution", {})
             if date_dist:
-                report.append(f"   📊 日期分布:")
+                yield "   📊 日期分布:"
                 for period, count in date_dist.items():
-                    report.append(f"      {period}: {count} 篇")
+                    yield f"      {period}: {count} 篇"
             
             # 显示时间过滤效果
             within_range = date_analysis.get("within_range", 0)
             outside_range = date_analysis.get("outside_range", 0)
             
             if outside_range > 0:
-                report.append(f"   ⚠️  时间过滤效果: {within_range} 篇在范围内, {outside_range} 篇超出范围")
+                yield f"   ⚠️  时间过滤效果: {within_range} 篇在范围内, {outside_range} 篇超出范围"
                 problematic_sources.append(source)
                 
                 # 显示最老的文章
                 oldest = date_analysis.get("oldest_article")
                 if oldest:
-                    report.append(f"   📅 最老文章: {oldest['days_old']}天前 - {oldest['title']}")
+                    yield f"   📅 最老文章: {oldest['days_old']}天前 - {oldest['title']}"
             else:
-                report.append(f"   ✅ 时间过滤效果: 所有 {within_range} 篇文章都在时间范围内")
+                yield f"   ✅ 时间过滤效果: 所有 {within_range} 篇文章都在时间范围内"
             
-            report.append("")
+            yield ""
         
-        report.append("2. 总体统计:")
-        report.append("-" * 60)
-        report.append(f"总文章数: {total_articles}")
-        report.append(f"时间范围内: {total_within_range}")
-        report.append(f"超出时间范围: {total_outside_range}")
+        yield "2. 总体统计:"
+        yield "-" * 60
+        yield f"总文章数: {total_articles}"
+        yield f"时间范围内: {total_within_range}"
+        yield f"超出时间范围: {total_outside_range}"
         
         if total_articles > 0:
             accuracy = (total_within_range / total_articles) * 100
-            report.append(f"时间过滤准确率: {accuracy:.1f}%")
+            yield f"时间过滤准确率: {accuracy:.1f}%"
         
-        report.append("")
+        yield ""
         
-        report.append("3. 修复效果评估:")
-        report.append("-" * 60)
+        yield "3. 修复效果评估:"
+        yield "-" * 60
         
         if problematic_sources:
-            report.append(f"❌ 仍有问题的搜索源: {', '.join(problematic_sources)}")
-            report.append("   这些搜索源仍然返回超出时间范围的文章")
+            yield f"❌ 仍有问题的搜索源: {', '.join(problematic_sources)}"
+            yield "   这些搜索源仍然返回超出时间范围的文章"
         else:
-            report.append("✅ 所有搜索源的时间过滤都正常工作")
+            yield "✅ 所有搜索源的时间过滤都正常工作"
         
         if total_outside_range == 0:
-            report.append("🎉 时间过滤修复成功！所有文章都在指定时间范围内")
+            yield "🎉 时间过滤修复成功！所有文章都在指定时间范围内"
         else:
-            report.append(f"⚠️  仍有 {total_outside_range} 篇文章超出时间范围，需要进一步优化")
+            yield f"⚠️  仍有 {total_outside_range} 篇文章超出时间范围，需要进一步优化"
         
-        report.append("")
+        yield ""
         
-        report.append("4. 修复内容总结:")
-        report.append("-" * 60)
-        report.append("✅ Brave Search API: 添加了 freshness 参数支持")
-        report.append("✅ Tavily API: 添加了 time_range 和 days 参数支持")
-        report.append("✅ Serper API: 添加了客户端时间过滤")
-        report.append("✅ MetaSota API: 优化了客户端时间过滤")
-        report.append("✅ 所有API: 都添加了客户端时间过滤作为备用")
+        yield "4. 修复内容总结:"
+        yield "-" * 60
+        yield "✅ Brave Search API: 添加了 freshness 参数支持"
+        yield "✅ Tavily API: 添加了 time_range 和 days 参数支持"
+        yield "✅ Serper API: 添加了客户端时间过滤"
+        yield "✅ MetaSota API: 优化了客户端时间过滤"
+        yield "✅ 所有API: 都添加了客户端时间过滤作为备用"
         
-        return "\n".join(report)
+    def generate_detailed_report(self, test_results: Dict[str, Any]) -> str:
+        """生成详细的测试报告"""
+        return "\n".join(self.iter_detailed_report(test_results))
+
 
-async def main():
-    """主函数"""
-    tester = DateFilteringTester()
+async def main(refresh: bool = False, json_report: Optional[str] = None):
+    """主函数；refresh 为True时忽略缓存重新搜索，json_report 指定时额外保存JSON格式的测试结果"""
+    # 各源的同步搜索经 asyncio.to_thread 进入默认线程池，放大线程池避免并发测试时排队
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(
+        ThreadPoolExecutor(max_workers=int(os.getenv("THREAD_POOL_SIZE", "32")))
+    )
     
-    # 测试所有搜索源
+    tester = DateFilteringTester(refresh=refresh)
+    
+    # 测试所有搜索源，所有源共用同一个基准时间
     test_results = {}
     available_sources = tester.collector.get_available_sources()
+    now = datetime.now(timezone.utc)
+    
+    # 收集器中没有对应工具的源直接记为不可用，只为可用的源创建测试协程
+    tools = tester.collector.tools
+    testable_sources = [source for source in available_sources if tools.get(source)]
     
+    # 各源相互独立，并发测试，总耗时约为最慢来源的耗时
+    results = await asyncio.gather(
+        *(
+            tester.test_single_source_detailed(
+                source, "artificial intelligence", days_back=1, now=now
+            )
+            for source in testable_sources
+        ),
+        return_exceptions=True,
+    )
+    results_by_source = dict(zip(testable_sources, results))
     for source in available_sources:
-        result = await tester.test_single_source_detailed(source, "artificial intelligence", days_back=1)
+        result = results_by_source.get(source)
+        if result is None:
+            result = {"error": f"搜索源 {source} 不可用"}
+        elif isinstance(result, Exception):
+            result = {"error": str(result)}
         test_results[source] = result
     
-    # 生成详细报告
-    report = tester.generate_detailed_report(test_results)
-    
-    print(report)
-    
-    # 保存报告到文件
+    # 逐行生成详细报告，同时输出到终端并保存到文件
     with open("date_filtering_fix_verification_report.txt", "w", encoding="utf-8") as f:
-        f.write(report)
+        for line in tester.iter_detailed_report(test_results):
+            print(line)
+            f.write(line + "\n")
     
     print("\n详细验证报告已保存到: date_filtering_fix_verification_report.txt")
+    
+    if json_report:
+        write_json_report(test_results, json_report)
+        print(f"JSON测试结果已保存到: {json_report}")
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description="验证各搜索源的时间过滤效果")
+    parser.add_argument("--refresh", action="store_true", help="忽略缓存的搜索结果，重新请求")
+    parser.add_argument("--json-report", metavar="PATH", help="将各源的测试结果另存为JSON文件")
+    args = parser.parse_args()
+    asyncio.run(main(refresh=args.refresh, json_report=args.json_report))
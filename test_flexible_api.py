@@ -30,6 +30,14 @@ from ai_news_collector_lib import (
     collect_with_multiple_engines
 )
 
+# 时间范围预设测试用到的时间范围及其描述
+_TIME_RANGE_PRESETS = (
+    (TimeRange.ONE_DAY, "一天"),
+    (TimeRange.ONE_WEEK, "一周"),
+    (TimeRange.ONE_MONTH, "一个月"),
+    (TimeRange.ONE_YEAR, "一年"),
+)
+
 
 async def test_single_engine():
     """测试单个搜索引擎"""
@@ -129,15 +137,8 @@ async def test_time_range_presets():
         
         collector = FlexibleAINewsCollector(config)
         
-        # 测试不同时间范围
-        time_ranges = [
-            (TimeRange.ONE_DAY, "一天"),
-            (TimeRange.ONE_WEEK, "一周"),
-            (TimeRange.ONE_MONTH, "一个月"),
-            (TimeRange.ONE_YEAR, "一年")
-        ]
-        
-        for time_range, desc in time_ranges:
+        # 测试不同时间范围：时间范围保存在同一个收集器的引擎配置上，只能依次执行
+        for time_range, desc in _TIME_RANGE_PRESETS:
             collector.set_time_range_for_engine("hackernews", time_range)
             result = await collector.collect_news("AI")
             print(f"  {desc}: {result.unique_articles} 篇文章")
@@ -193,15 +194,17 @@ async def main():
         test_dynamic_config_update
     ]
     
-    passed = 0
     total = len(tests)
     
-    for test in tests:
-        try:
-            if await test():
-                passed += 1
-        except Exception as e:
-            print(f"❌ 测试异常: {e}")
+    # 各场景相互独立，并发执行，总耗时约为最慢场景的耗时（输出可能交错）
+    results = await asyncio.gather(*(test() for test in tests), return_exceptions=True)
+    
+    passed = 0
+    for result in results:
+        if isinstance(result, Exception):
+            print(f"❌ 测试异常: {result}")
+        elif result:
+            passed += 1
     
     print(f"\n📊 测试结果: {passed}/{total} 通过")
     
@@ -1,12 +1,29 @@
+import copy
 import os
 import pytest
 from dotenv import load_dotenv
 import vcr
 
+from ai_news_collector_lib import (
+    AdvancedAINewsCollector,
+    AdvancedSearchConfig,
+    AINewsCollector,
+    SearchConfig,
+)
+from ai_news_collector_lib.tools import search_tools
+
+from helpers import CASSETTE_DIR
+
 # 加载本地 .env，以便测试根据环境开关网络等行为
 load_dotenv()
 
 
+@pytest.fixture(autouse=True)
+def serial_hackernews_fetch(monkeypatch):
+    """VCR 的磁带回放不是线程安全的，测试中串行获取 HackerNews 故事详情。"""
+    monkeypatch.setattr(search_tools, "HN_FETCH_WORKERS", 1)
+
+
 @pytest.fixture(scope="session")
 def allow_network() -> bool:
     """是否允许网络测试，由 .env 的 ALLOW_NETWORK 控制。"""
@@ -25,7 +42,6 @@ def days_back() -> int:
 
 @pytest.fixture(scope="session")
 def search_config(max_articles, days_back):
-    from ai_news_collector_lib import SearchConfig
     cfg = SearchConfig(
         enable_hackernews=True,
         enable_arxiv=True,
@@ -37,15 +53,14 @@ def search_config(max_articles, days_back):
     return cfg
 
 
-@pytest.fixture(scope="session")
+@pytest.fixture
 def collector(search_config):
-    from ai_news_collector_lib import AINewsCollector
-    return AINewsCollector(search_config)
+    """每个测试使用基于配置副本的新收集器，避免测试间修改的配置或状态相互影响。"""
+    return AINewsCollector(copy.deepcopy(search_config))
 
 
 @pytest.fixture(scope="session")
 def advanced_config(max_articles, days_back):
-    from ai_news_collector_lib import AdvancedSearchConfig
     cfg = AdvancedSearchConfig(
         enable_hackernews=True,
         enable_arxiv=True,
@@ -60,10 +75,10 @@ def advanced_config(max_articles, days_back):
     return cfg
 
 
-@pytest.fixture(scope="session")
+@pytest.fixture
 def advanced_collector(advanced_config):
-    from ai_news_collector_lib import AdvancedAINewsCollector
-    return AdvancedAINewsCollector(advanced_config)
+    """同 collector：每个测试基于配置副本新建高级收集器。"""
+    return AdvancedAINewsCollector(copy.deepcopy(advanced_config))
 
 
 # =====================
@@ -83,18 +98,20 @@ def _get_record_mode(allow_net: bool) -> str:
     return "once"
 
 
-# 统一的 VCR 实例（磁带目录在 tests/cassettes）
-_cassette_dir = os.path.join(os.path.dirname(__file__), "cassettes")
-os.makedirs(_cassette_dir, exist_ok=True)
+@pytest.fixture(scope="session")
+def cassette_set() -> frozenset:
+    """磁带目录中的文件名集合：整个会话只读取一次目录，代替逐个检查文件是否存在。"""
+    return frozenset(os.listdir(CASSETTE_DIR))
 
 
+# 统一的 VCR 实例（磁带目录在 tests/cassettes）
 @pytest.fixture(scope="session")
 def vcr_vcr(allow_network):
     """提供配置好的 VCR 实例供测试使用。"""
     # 在 PR/CI 离线模式下（record_mode=none），忽略 query 以避免因动态日期等参数导致匹配失败
     matchers = ["method", "path"] if not allow_network else ["method", "path", "query"]
     return vcr.VCR(
-        cassette_library_dir=_cassette_dir,
+        cassette_library_dir=CASSETTE_DIR,
         record_mode=_get_record_mode(allow_network),
         filter_headers=["Authorization", "X-API-KEY"],
         filter_query_parameters=["apiKey", "key"],
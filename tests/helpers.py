@@ -0,0 +1,85 @@
+"""
+测试共用的辅助函数与常量
+"""
+
+import json
+import os
+from typing import Any, Dict, Optional
+
+from ai_news_collector_lib.models.article import Article
+
+# 统一的磁带目录（tests/cassettes）
+CASSETTE_DIR = os.path.join(os.path.dirname(__file__), "cassettes")
+os.makedirs(CASSETTE_DIR, exist_ok=True)
+
+# 付费API的cassette文件名
+PAID_CASSETTES = frozenset({
+    "tavily_search.yaml",
+    "google_search.yaml",
+    "serper_search.yaml",
+    "brave_search.yaml",
+    "metasota_search.yaml",
+    "newsapi_search.yaml",
+})
+
+
+# 是否存在任何付费API的cassette：模块导入时只读取一次磁带目录
+_PAID_CASSETTE_PRESENT = not PAID_CASSETTES.isdisjoint(os.listdir(CASSETTE_DIR))
+
+
+def should_test_paid_apis() -> bool:
+    """
+    检查是否应该测试付费API。
+    如果存在对应的cassette文件，即使没有设置环境变量也可以测试。
+    """
+    return os.getenv("TEST_PAID_APIS", "0") == "1" or _PAID_CASSETTE_PRESENT
+
+
+def make_article(
+    title: Optional[str] = None,
+    published: str = "2025-10-01T00:00:00+00:00",
+    source: str = "test",
+) -> Article:
+    """构造离线测试用的文章；未指定标题时以发布时间（为空则用 "empty"）作为标题"""
+    if title is None:
+        title = published or "empty"
+    return Article(
+        title=title,
+        url=f"https://example.com/{title}",
+        summary="",
+        published=published,
+        author="tester",
+        source_name="Example",
+        source=source,
+    )
+
+
+class FakeResp:
+    """
+    离线测试用的 requests 响应替身
+
+    只给 data 时按JSON序列化出 content/text；也可直接给出 content（字节）或 text。
+    """
+
+    def __init__(
+        self,
+        data: Any = None,
+        *,
+        content: Optional[bytes] = None,
+        text: Optional[str] = None,
+        status_code: int = 200,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        self._data = data
+        if content is None:
+            content = (json.dumps(data) if text is None else text).encode("utf-8")
+        self.content = content
+        self.text = text if text is not None else content.decode("utf-8", "replace")
+        self.status_code = status_code
+        self.headers = {"content-type": "application/json"} if headers is None else headers
+
+    def json(self):
+        return self._data
+
+    def raise_for_status(self):
+        return None
@@ -0,0 +1,36 @@
+import sys
+
+import pytest
+
+from ai_news_collector_lib.models.article import AdvancedArticle, Article
+
+FIELDS = dict(
+    title="t",
+    url="https://example.com",
+    summary="s",
+    published="2025-10-01T00:00:00+00:00",
+    author="a",
+    source_name="Example",
+    source="test",
+)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots requires Python 3.10+")
+def test_articles_use_slots():
+    assert not hasattr(Article(**FIELDS), "__dict__")
+    assert not hasattr(AdvancedArticle(**FIELDS), "__dict__")
+
+
+def test_advanced_article_inherits_base_behaviour():
+    article = AdvancedArticle(**FIELDS, word_count=450, keywords=["ai"])
+
+    assert article.reading_time == 2
+    assert article.to_dict() == {
+        **Article(**FIELDS).to_dict(),
+        "keywords": ["ai"],
+        "sentiment": None,
+        "word_count": 450,
+        "reading_time": 2,
+        "hash_id": "",
+    }
+    assert AdvancedArticle.from_dict(article.to_dict()) == article
@@ -2,21 +2,9 @@ import types
 from datetime import datetime, timedelta, timezone
 import pytest
 
-from ai_news_collector_lib.tools.search_tools import ArxivTool
+from ai_news_collector_lib.tools.search_tools import ArxivTool, _iso_to_ts
 
-
-class FakeResp:
-    def __init__(self, content: bytes):
-        self.content = content
-        self.status_code = 200
-
-    def raise_for_status(self):
-        return None
-
-
-def bs_raises(*args, **kwargs):
-    # 强制 BeautifulSoup 解析失败，以触发 feedparser 回退逻辑
-    raise Exception("Forced BeautifulSoup failure for fallback")
+from helpers import FakeResp
 
 
 # 仅包含 updated 的 Atom 示例（用于 updated_parsed 回退）
@@ -66,20 +54,25 @@ ATOM_NO_DATES = (
 ).encode("utf-8")
 
 
-def _patch_requests_and_bs(monkeypatch, content_bytes: bytes):
-    # patch BeautifulSoup to raise within module
+def _patch_session(monkeypatch, content_bytes: bytes):
     import ai_news_collector_lib.tools.search_tools as st
-    monkeypatch.setattr(st, "BeautifulSoup", bs_raises)
 
-    # patch requests.get in module scope to return our fake response
+    # patch the shared session in module scope to return our fake response
     def fake_get(url, timeout=30):
-        return FakeResp(content_bytes)
+        return FakeResp(content=content_bytes)
+
+    monkeypatch.setattr(st, "_SESSION", types.SimpleNamespace(get=fake_get))
 
-    monkeypatch.setattr(st, "requests", types.SimpleNamespace(get=fake_get))
+
+def _patch_requests_and_lxml(monkeypatch, content_bytes: bytes):
+    # 模拟 lxml 不可用，以走 feedparser 回退逻辑
+    import ai_news_collector_lib.tools.search_tools as st
+    monkeypatch.setattr(st, "etree", None)
+    _patch_session(monkeypatch, content_bytes)
 
 
 def test_arxiv_fallback_updated(monkeypatch):
-    _patch_requests_and_bs(monkeypatch, ATOM_UPDATED)
+    _patch_requests_and_lxml(monkeypatch, ATOM_UPDATED)
     tool = ArxivTool(max_articles=1)
     # 避免被 _filter_by_date 误过滤，设置 days_back=0
     articles = tool.search("test", days_back=0)
@@ -93,7 +86,7 @@ def test_arxiv_fallback_updated(monkeypatch):
 
 
 def test_arxiv_fallback_published(monkeypatch):
-    _patch_requests_and_bs(monkeypatch, ATOM_PUBLISHED)
+    _patch_requests_and_lxml(monkeypatch, ATOM_PUBLISHED)
     tool = ArxivTool(max_articles=1)
     # 避免被 _filter_by_date 误过滤，设置 days_back=0
     articles = tool.search("test", days_back=0)
@@ -106,7 +99,7 @@ def test_arxiv_fallback_published(monkeypatch):
 
 
 def test_arxiv_fallback_now(monkeypatch):
-    _patch_requests_and_bs(monkeypatch, ATOM_NO_DATES)
+    _patch_requests_and_lxml(monkeypatch, ATOM_NO_DATES)
     tool = ArxivTool(max_articles=1)
     start = datetime.now(timezone.utc) - timedelta(seconds=10)
     # 避免被 _filter_by_date 误过滤，设置 days_back=0
@@ -116,10 +109,82 @@ def test_arxiv_fallback_now(monkeypatch):
     assert len(articles) == 1
     a = articles[0]
     # fallback 至 datetime.now()：断言在合理时间窗口内
-    pub = datetime.fromisoformat(a.published.replace('Z', '+00:00'))
-    # 确保 pub 是时区感知的，如果不是则假设为 UTC
-    if pub.tzinfo is None:
-        pub = pub.replace(tzinfo=timezone.utc)
-    assert start <= pub <= end, (start, pub, end)
+    # naive 时间按 UTC 解析为时间戳
+    pub_ts = _iso_to_ts(a.published)
+    assert start.timestamp() <= pub_ts <= end.timestamp(), (start, a.published, end)
     assert a.source == "arxiv"
-    assert a.source_name == "ArXiv"
\ No newline at end of file
+    assert a.source_name == "ArXiv"
+
+
+# 完整的 ArXiv 条目（用于 lxml 主解析路径）
+ATOM_FULL = (
+    """<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Test Feed</title>
+  <entry>
+    <id>http://arxiv.org/abs/1111.1111</id>
+    <title>  First paper  </title>
+    <summary> First summary </summary>
+    <published>2025-10-02T01:02:03Z</published>
+    <author><name>Alice</name></author>
+    <author><name>Bob</name></author>
+  </entry>
+  <entry>
+    <id>http://arxiv.org/abs/2222.2222</id>
+    <title>Entry without dates is skipped</title>
+    <summary>Summary</summary>
+  </entry>
+  <entry>
+    <id>http://arxiv.org/abs/3333.3333</id>
+    <title>Second paper</title>
+    <summary>Second summary</summary>
+    <published>2025-10-01T00:00:00Z</published>
+    <author><name>Carol</name></author>
+  </entry>
+</feed>
+"""
+).encode("utf-8")
+
+
+def test_arxiv_lxml_parses_entries(monkeypatch):
+    import ai_news_collector_lib.tools.search_tools as st
+    if st.etree is None:
+        pytest.skip("lxml not installed")
+    _patch_session(monkeypatch, ATOM_FULL)
+    tool = ArxivTool(max_articles=5)
+    articles = tool.search("test", days_back=0)
+
+    assert [a.title for a in articles] == ["First paper", "Second paper"]
+    first = articles[0]
+    assert first.url == "http://arxiv.org/abs/1111.1111"
+    assert first.summary == "First summary..."
+    assert first.author == "Alice, Bob"
+    assert first.published.startswith("2025-10-02T01:02:03")
+
+
+def test_arxiv_malformed_atom_falls_back_to_feedparser(monkeypatch):
+    import ai_news_collector_lib.tools.search_tools as st
+    if st.etree is None:
+        pytest.skip("lxml not installed")
+    # 未转义的 & 会让 lxml 拒绝整个文档，feedparser 仍能容错解析
+    _patch_session(monkeypatch, ATOM_PUBLISHED.replace(b"<summary>", b"<summary>R&D "))
+    articles = ArxivTool(max_articles=1).search("test", days_back=0)
+
+    assert len(articles) == 1
+    assert articles[0].published.startswith("2023-08-15T08:09:10")
+
+
+def test_arxiv_unknown_payload_returns_empty(monkeypatch):
+    import ai_news_collector_lib.tools.search_tools as st
+    monkeypatch.setattr(st.feedparser, "parse", lambda *a, **k: pytest.fail("should not parse"))
+    _patch_session(monkeypatch, b"<html><body>Service unavailable</body></html>")
+
+    assert ArxivTool(max_articles=1).search("test", days_back=0) == []
+
+
+def test_detect_feed():
+    from ai_news_collector_lib.tools.search_tools import _detect_feed
+
+    assert _detect_feed(ATOM_FULL) == "atom"
+    assert _detect_feed(b'<?xml version="1.0"?><rss version="2.0"></rss>') == "rss"
+    assert _detect_feed(b"") == "unknown"
@@ -0,0 +1,64 @@
+import types
+
+import pytest
+
+from ai_news_collector_lib.tools.search_tools import _is_ddg_allowed_domain
+
+from helpers import FakeResp
+
+
+@pytest.mark.parametrize(
+    "url, allowed",
+    [
+        ("https://techcrunch.com/2025/10/01/ai/", True),
+        ("https://www.theverge.com/ai", True),
+        ("https://WIRED.com/story", True),
+        ("https://nottechcrunch.com/ai", False),
+        ("https://example.com/?ref=venturebeat.com", False),
+        ("/l/?uddg=https%3A%2F%2Ftechcrunch.com", False),
+    ],
+)
+def test_ddg_domain_whitelist(url, allowed):
+    assert _is_ddg_allowed_domain(url) is allowed
+
+
+DDG_HTML = """
+<html><body>
+  <div class="header"><a href="/settings">Settings</a></div>
+  <div class="results">
+    <a class="result__a" href="/l/?uddg=https%3A%2F%2Ftechcrunch.com%2Fai&amp;rut=1">
+      <b>OpenAI</b> ships a new model
+    </a>
+    <a class="result__snippet">no href</a>
+    <a class="result__a">result anchor without href</a>
+    <a class="result__a result__a--ad" href="https://wired.com/ad">Sponsored wired link</a>
+  </div>
+</body></html>
+"""
+
+
+def test_extract_result_links_matches_beautifulsoup(monkeypatch):
+    from ai_news_collector_lib.tools import search_tools as st
+
+    expected = [
+        ("/l/?uddg=https%3A%2F%2Ftechcrunch.com%2Fai&rut=1", "OpenAIships a new model"),
+        ("https://wired.com/ad", "Sponsored wired link"),
+    ]
+    assert st._extract_result_links(DDG_HTML) == expected
+    assert st._extract_result_links("") == []
+
+    monkeypatch.setattr(st, "HTMLParser", None)
+    monkeypatch.setattr(st, "lxml_html", None)
+    assert st._extract_result_links(DDG_HTML) == expected
+
+
+def test_ddg_resolves_uddg_redirects(monkeypatch):
+    from ai_news_collector_lib.tools import search_tools as st
+
+    monkeypatch.setattr(
+        st, "_SESSION", types.SimpleNamespace(get=lambda *a, **k: FakeResp(text=DDG_HTML))
+    )
+
+    articles = st.DuckDuckGoTool(max_articles=5).search("openai", days_back=7)
+
+    assert [a.url for a in articles] == ["https://techcrunch.com/ai", "https://wired.com/ad"]
@@ -0,0 +1,206 @@
+"""
+FlexibleAINewsCollector 单元测试（离线）
+"""
+
+import pytest
+
+import ai_news_collector_lib.core.flexible_collector as fc
+from ai_news_collector_lib import FlexibleAINewsCollector, TimeRange, create_flexible_config
+
+from helpers import make_article
+
+
+TITLES = [
+    "OpenAI releases GPT-5 with improved reasoning",
+    "openai releases gpt-5 with improved reasoning",
+    "OpenAI releases GPT-5 with better reasoning",
+    "Google announces Gemini 2.5 Pro",
+    "Nvidia stock surges after earnings beat",
+    "Meta open-sources Llama 4",
+]
+
+
+@pytest.fixture
+def flexible_collector():
+    config = create_flexible_config(enabled_engines=["hackernews"])
+    return FlexibleAINewsCollector(config)
+
+
+@pytest.fixture
+def clean_dedup_cache():
+    fc.clear_dedup_cache()
+    yield
+    fc.clear_dedup_cache()
+
+
+@pytest.mark.parametrize("use_rapidfuzz", [True, False])
+@pytest.mark.parametrize("use_lsh", [True, False])
+def test_deduplicate_articles(
+    flexible_collector, monkeypatch, clean_dedup_cache, use_lsh, use_rapidfuzz
+):
+    if use_lsh and fc.MinHashLSH is None:
+        pytest.skip("datasketch 未安装")
+    if use_rapidfuzz and fc.fuzz is None:
+        pytest.skip("rapidfuzz 未安装")
+    if not use_lsh:
+        monkeypatch.setattr(fc, "MinHashLSH", None)
+    if not use_rapidfuzz:
+        monkeypatch.setattr(fc, "fuzz", None)
+
+    articles = [make_article(t) for t in TITLES]
+    unique = flexible_collector._deduplicate_articles(articles, similarity_threshold=0.85)
+
+    assert [a.title for a in unique] == [
+        "OpenAI releases GPT-5 with improved reasoning",
+        "Google announces Gemini 2.5 Pro",
+        "Nvidia stock surges after earnings beat",
+        "Meta open-sources Llama 4",
+    ]
+
+
+def test_deduplicate_articles_keeps_order_and_first_seen(flexible_collector):
+    articles = [
+        make_article("Same title", source="arxiv"),
+        make_article("Same title", source="hackernews"),
+    ]
+    unique = flexible_collector._deduplicate_articles(articles)
+
+    assert len(unique) == 1
+    assert unique[0].source == "arxiv"
+
+
+def test_create_tool_dispatch(flexible_collector):
+    from ai_news_collector_lib.config.flexible_config import EngineConfig
+    from ai_news_collector_lib.tools.search_tools import BraveSearchTool, HackerNewsTool
+
+    tool = flexible_collector._create_tool("hackernews", EngineConfig(max_articles=3))
+    assert isinstance(tool, HackerNewsTool)
+    assert tool.max_articles == 3
+
+    assert flexible_collector._create_tool("tavily", EngineConfig()) is None
+    assert flexible_collector._create_tool("rss_feeds", EngineConfig()) is None
+    assert flexible_collector._create_tool("unknown", EngineConfig()) is None
+    assert isinstance(
+        flexible_collector._create_tool("bing_search", EngineConfig(api_key="k")), BraveSearchTool
+    )
+
+
+@pytest.mark.parametrize("threshold", [0.5, 0.85])
+def test_length_window_covers_possible_matches(threshold):
+    for length in range(0, 60):
+        window = fc._length_window(length, threshold)
+        for other in range(0, 200):
+            if fc._length_may_match(length, other, threshold):
+                assert other in window
+
+
+class _FakeTool:
+    def __init__(self, titles, delay=0.0, error=None):
+        self.titles = titles
+        self.delay = delay
+        self.error = error
+
+    def search(self, query, days_back):
+        import time
+
+        time.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return [make_article(title) for title in self.titles]
+
+
+@pytest.mark.asyncio
+async def test_collect_news_reports_engines_as_they_complete():
+    config = create_flexible_config(enabled_engines=["hackernews", "arxiv", "duckduckgo"])
+    collector = FlexibleAINewsCollector(config)
+    collector.tools = {
+        "hackernews": _FakeTool(["Slow engine story"], delay=0.3),
+        "arxiv": _FakeTool(["Fast engine paper"]),
+        "duckduckgo": _FakeTool([], error=RuntimeError("boom")),
+    }
+    messages = []
+
+    result = await collector.collect_news("ai", progress_callback=messages.append)
+
+    done = [m for m in messages if m.startswith("完成")]
+    assert done == ["完成 arxiv: 1 篇文章", "完成 hackernews: 1 篇文章"]
+    # 合并顺序与引擎顺序一致，与完成先后无关
+    assert [a.title for a in result.articles] == ["Slow engine story", "Fast engine paper"]
+    assert result.source_progress["duckduckgo"]["status"] == "failed"
+    assert result.source_progress["duckduckgo"]["error"] == "boom"
+
+
+@pytest.mark.asyncio
+async def test_collect_news_respects_max_concurrent_engines():
+    import threading
+
+    config = create_flexible_config(enabled_engines=["hackernews", "arxiv", "duckduckgo"])
+    config.max_concurrent_engines = 1
+    collector = FlexibleAINewsCollector(config)
+    lock = threading.Lock()
+    state = {"running": 0, "peak": 0}
+
+    class _CountingTool(_FakeTool):
+        def search(self, query, days_back):
+            with lock:
+                state["running"] += 1
+                state["peak"] = max(state["peak"], state["running"])
+            try:
+                return super().search(query, days_back)
+            finally:
+                with lock:
+                    state["running"] -= 1
+
+    collector.tools = {
+        name: _CountingTool([f"{name} story"], delay=0.05) for name in collector.tools
+    }
+
+    result = await collector.collect_news("ai")
+
+    assert state["peak"] == 1
+    assert result.total_articles == 3
+
+
+def test_get_engine_info(flexible_collector):
+    info = flexible_collector.get_engine_info()
+    assert info["hackernews"]["name"] == "HackerNewsTool"
+    assert info["hackernews"]["days_back"] == 7
+
+    flexible_collector.set_time_range_for_engine("hackernews", TimeRange.ONE_DAY)
+    flexible_collector.tools["hackernews"] = _FakeTool([])
+    info = flexible_collector.get_engine_info()
+    assert info["hackernews"]["name"] == "_FakeTool"
+    assert info["hackernews"]["time_range"] == "1d"
+    assert info["hackernews"]["days_back"] == 1
+
+
+def test_pair_ratio_cache(flexible_collector):
+    fc.clear_dedup_cache()
+    articles = [make_article(title) for title in TITLES]
+
+    flexible_collector._deduplicate_articles(articles, 0.85)
+    misses = fc._pair_ratio.cache_info().misses
+    flexible_collector._deduplicate_articles(articles, 0.85)
+    info = fc._pair_ratio.cache_info()
+
+    assert info.misses == misses
+    assert info.hits > 0
+
+    fc.clear_dedup_cache()
+    assert fc._pair_ratio.cache_info().currsize == 0
+
+
+@pytest.mark.asyncio
+async def test_collect_news_only_searches_valid_engines(flexible_collector):
+    flexible_collector.tools = {"hackernews": _FakeTool(["Only story"])}
+
+    result = await flexible_collector.collect_news(
+        "ai", engines=["hackernews", "tavily", "unknown", "hackernews"]
+    )
+
+    assert list(result.source_progress) == ["hackernews"]
+    assert result.total_articles == 1
+
+    empty = await flexible_collector.collect_news("ai", engines=[])
+    assert empty.total_articles == 0
+    assert empty.source_progress == {}
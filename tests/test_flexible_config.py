@@ -0,0 +1,127 @@
+"""
+FlexibleSearchConfig / EngineConfig 单元测试（离线）
+"""
+
+import os
+import sys
+
+import pytest
+
+from ai_news_collector_lib.config.flexible_config import (
+    EngineConfig,
+    FlexibleSearchConfig,
+    TimeRange,
+    create_flexible_config,
+    create_single_engine_config,
+)
+
+
+def test_effective_days_back_defaults():
+    assert EngineConfig().get_effective_days_back() == 7
+    assert EngineConfig(time_range=TimeRange.ONE_YEAR).get_effective_days_back() == 365
+    assert (
+        EngineConfig(time_range=TimeRange.CUSTOM, days_back=3).get_effective_days_back() == 3
+    )
+
+
+@pytest.mark.parametrize("enabled", [True, False])
+def test_fast_default_matches_constructor(enabled):
+    fast = EngineConfig._fast_default(enabled=enabled)
+    assert fast == EngineConfig(enabled=enabled)
+    assert fast.get_effective_days_back() == 7
+
+    # 实例之间不共享状态
+    fast.max_articles = 1
+    assert EngineConfig._fast_default().max_articles == 10
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots 需要 Python 3.10+")
+def test_configs_use_slots():
+    assert not hasattr(EngineConfig(), "__dict__")
+    assert not hasattr(FlexibleSearchConfig(), "__dict__")
+    assert not hasattr(EngineConfig._fast_default(), "__dict__")
+
+
+def test_effective_days_back_refreshed_by_setters():
+    config = FlexibleSearchConfig()
+
+    config.set_engine_config("hackernews", time_range=TimeRange.CUSTOM, custom_days=14)
+    assert config.get_engine_config("hackernews").get_effective_days_back() == 14
+
+    config.set_engine_time_range("hackernews", TimeRange.ONE_DAY)
+    assert config.get_engine_config("hackernews").get_effective_days_back() == 1
+
+    config.set_time_range_preset(TimeRange.ONE_MONTH)
+    for engine_config in config.engines.values():
+        assert engine_config.get_effective_days_back() == 30
+
+
+def test_direct_field_writes_are_not_stale():
+    config = create_flexible_config(enabled_engines=["hackernews", "arxiv"])
+    engine_config = config.get_engine_config("hackernews")
+
+    engine_config.enabled = False
+    assert config.get_enabled_engines() == ["arxiv"]
+
+    engine_config.time_range = TimeRange.CUSTOM
+    engine_config.custom_days = 3
+    assert engine_config.get_effective_days_back() == 3
+
+
+def test_api_keys_read_from_env_when_config_is_built(monkeypatch):
+    monkeypatch.setenv("TAVILY_API_KEY", "tvly-test")
+    monkeypatch.setenv("GOOGLE_API_KEY", "google-test")
+    config = FlexibleSearchConfig()
+    engine_config = config.get_engine_config("tavily")
+    assert engine_config.api_key == "tvly-test"
+    assert engine_config.enabled
+    assert config.llm_api_key == "google-test"
+
+    # 导入后修改的环境变量在下一次构造配置时生效
+    monkeypatch.delenv("TAVILY_API_KEY")
+    assert FlexibleSearchConfig().get_engine_config("tavily").api_key is None
+
+
+def test_enabled_engines_tracked_by_mutators():
+    config = create_flexible_config(enabled_engines=["hackernews", "arxiv"])
+    assert config.get_enabled_engines() == ["hackernews", "arxiv"]
+
+    config.set_engine_config("arxiv", enabled=False)
+    config.set_engine_config("duckduckgo", enabled=True)
+    assert config.get_enabled_engines() == ["hackernews", "duckduckgo"]
+    assert config.validate_config()["engine_count"] == 2
+
+    assert create_single_engine_config("arxiv").get_enabled_engines() == ["arxiv"]
+
+
+def test_for_engines_does_not_auto_enable_keyed_engines(monkeypatch):
+    monkeypatch.setenv("TAVILY_API_KEY", "tvly-test")
+    config = create_flexible_config(enabled_engines=["hackernews"])
+    assert config.get_enabled_engines() == ["hackernews"]
+    # 未启用的引擎仍保留默认配置和环境变量中的密钥
+    assert config.get_engine_config("tavily").api_key == "tvly-test"
+    assert len(config.engines) == 11
+
+    single = create_single_engine_config("tavily", time_range=TimeRange.ONE_DAY)
+    assert single.get_enabled_engines() == ["tavily"]
+    assert single.get_engine_config("tavily").get_effective_days_back() == 1
+
+
+def test_load_env_once(monkeypatch):
+    from ai_news_collector_lib.config import env
+
+    calls = []
+    monkeypatch.setattr(env, "load_dotenv", lambda: calls.append(1))
+    monkeypatch.setattr(env, "_dotenv_loaded", False)
+    monkeypatch.delenv(env.DOTENV_SKIP_FLAG, raising=False)
+
+    assert env.load_env_once() is True
+    assert env.load_env_once() is False
+    assert calls == [1]
+    # 已加载标记不写入环境变量，子进程不会因继承它而跳过自己的 .env
+    assert "_AI_NEWS_DOTENV_LOADED" not in os.environ
+
+    env._dotenv_loaded = False
+    monkeypatch.setenv(env.DOTENV_SKIP_FLAG, "1")
+    assert env.load_env_once() is False
+    assert calls == [1]
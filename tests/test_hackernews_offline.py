@@ -0,0 +1,131 @@
+import types
+from datetime import datetime, timezone
+
+import pytest
+
+from ai_news_collector_lib.tools import search_tools as st
+from ai_news_collector_lib.tools.search_tools import HackerNewsTool
+
+from helpers import FakeResp
+
+
+NOW = int(datetime.now(timezone.utc).timestamp())
+
+STORIES = {
+    1: {"type": "story", "title": "Python 3.14 released", "time": NOW, "by": "a", "url": "u1"},
+    2: {"type": "job", "title": "Python job", "time": NOW},
+    3: {"type": "story", "title": "Rust in the kernel", "time": NOW, "url": "u3"},
+    4: {"type": "story", "title": "Why python packaging is hard", "time": NOW, "url": "u4"},
+    5: {"type": "story", "title": "Old python story", "time": NOW - 30 * 86400, "url": "u5"},
+    6: {"type": "story", "title": "Another Python story", "time": NOW, "url": "u6"},
+}
+
+
+def _patch_session(monkeypatch, requested, algolia_hits=None):
+    def fake_get(url, params=None, timeout=10):
+        if url == st.HN_ALGOLIA_SEARCH_URL:
+            if algolia_hits is None:
+                raise ConnectionError("algolia unavailable")
+            requested.append(params)
+            return FakeResp({"hits": algolia_hits})
+        if url.endswith("topstories.json"):
+            return FakeResp(list(STORIES) + [99])
+        story_id = int(url.rsplit("/", 1)[1].split(".")[0])
+        requested.append(story_id)
+        if story_id == 99:
+            raise ConnectionError("boom")
+        return FakeResp(STORIES[story_id])
+
+    monkeypatch.setattr(st, "_SESSION", types.SimpleNamespace(get=fake_get))
+
+
+def test_hackernews_concurrent_fetch_keeps_rank_order(monkeypatch):
+    monkeypatch.setattr(st, "HN_FETCH_WORKERS", 4)
+    requested = []
+    _patch_session(monkeypatch, requested)
+
+    articles = HackerNewsTool(max_articles=10).search("python", days_back=7)
+
+    assert [a.title for a in articles] == [
+        "Python 3.14 released",
+        "Why python packaging is hard",
+        "Another Python story",
+    ]
+    assert sorted(requested) == [1, 2, 3, 4, 5, 6, 99]
+
+
+def test_hackernews_stops_at_max_articles(monkeypatch):
+    requested = []
+    _patch_session(monkeypatch, requested)
+
+    articles = HackerNewsTool(max_articles=1).search("python", days_back=7)
+
+    assert [a.title for a in articles] == ["Python 3.14 released"]
+
+
+def test_hackernews_keywords_match_literally(monkeypatch):
+    _patch_session(monkeypatch, [])
+
+    tool = HackerNewsTool(max_articles=10)
+
+    assert [a.title for a in tool.search("rust++ KERNEL", days_back=7)] == ["Rust in the kernel"]
+    assert tool.search("   ", days_back=7) == []
+
+
+def test_hackernews_decodes_without_orjson(monkeypatch):
+    monkeypatch.setattr(st, "orjson", None)
+    _patch_session(monkeypatch, [])
+
+    articles = HackerNewsTool(max_articles=10).search("rust", days_back=7)
+
+    assert [a.title for a in articles] == ["Rust in the kernel"]
+
+
+def test_enable_http_cache_requires_requests_cache(monkeypatch):
+    monkeypatch.setattr(st, "requests_cache", None)
+
+    with pytest.raises(ImportError):
+        st.enable_http_cache()
+
+
+def test_enable_http_cache_swaps_shared_session(monkeypatch):
+    requests_cache = pytest.importorskip("requests_cache")
+    monkeypatch.setattr(st, "_SESSION", st._SESSION)
+
+    session = st.enable_http_cache("hn-test", backend="memory")
+
+    assert isinstance(session, requests_cache.CachedSession)
+    assert HackerNewsTool().session is session
+
+    st.disable_http_cache()
+    assert not isinstance(HackerNewsTool().session, requests_cache.CachedSession)
+
+
+def test_hackernews_uses_algolia_in_one_request(monkeypatch):
+    requested = []
+    hits = [
+        {
+            "title": "Python 3.14 released",
+            "url": "u1",
+            "points": 120,
+            "num_comments": 45,
+            "author": "a",
+            "created_at_i": NOW,
+        },
+        {"title": "Ask HN: python tips?", "url": None, "author": "b", "created_at_i": NOW},
+    ]
+    _patch_session(monkeypatch, requested, algolia_hits=hits)
+
+    articles = HackerNewsTool(max_articles=5).search("python", days_back=7)
+
+    assert [(a.title, a.url) for a in articles] == [
+        ("Python 3.14 released", "u1"),
+        ("Ask HN: python tips?", ""),
+    ]
+    assert articles[0].summary == "Score: 120 | Comments: 45"
+    assert articles[1].summary == "Score: 0 | Comments: 0"
+    assert len(requested) == 1
+    params = requested[0]
+    assert params["query"] == params["optionalWords"] == "python"
+    assert params["hitsPerPage"] == 5
+    assert params["numericFilters"].startswith("created_at_i>")
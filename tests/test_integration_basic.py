@@ -1,5 +1,6 @@
 import pytest
-from datetime import datetime
+
+from ai_news_collector_lib.tools.search_tools import _iso_to_ts
 
 
 @pytest.mark.asyncio
@@ -31,6 +32,6 @@ async def test_collect_news_basic_network(collector, allow_network, vcr_vcr):
         assert a.source in sources
         # published ISO 格式校验
         try:
-            datetime.fromisoformat(a.published.replace("Z", "+00:00"))
+            _iso_to_ts(a.published)
         except Exception:
             pytest.fail(f"Article published not ISO format: {a.published}")
\ No newline at end of file
@@ -0,0 +1,139 @@
+import json
+import types
+from datetime import datetime, timedelta
+
+import pytest
+
+from ai_news_collector_lib.tools import search_tools as st
+from ai_news_collector_lib.tools.search_tools import MetaSotaSearchTool
+
+from helpers import FakeResp
+
+
+def _fake_get(url, headers=None, timeout=None):
+    return FakeResp()
+
+
+def _mcp_payload(webpages, request_id=None):
+    payload = {"result": {"content": [{"text": json.dumps({"webpages": webpages})}]}}
+    if request_id is not None:
+        payload.update(jsonrpc="2.0", id=request_id)
+    return payload
+
+
+def test_metasota_defers_connection_check():
+    """创建 MetaSota 工具时不发请求，首次搜索时才检测一次连接"""
+    probes = []
+
+    def fake_get(url, headers=None, timeout=None):
+        probes.append(url)
+        return types.SimpleNamespace(status_code=503, headers={})
+
+    tool = MetaSotaSearchTool(api_key="test-api-key", max_articles=3)
+    tool.session = types.SimpleNamespace(get=fake_get)
+
+    assert probes == []
+    assert tool.search("computer vision") == []
+    assert tool.search("computer vision") == []
+    assert probes == [tool.mcp_base_url]
+
+
+@pytest.mark.asyncio
+async def test_metasota_search_async_falls_back_without_aiohttp(monkeypatch):
+    """未安装 aiohttp 时 search_async 退回线程池执行同步 search，结果一致"""
+    payload = _mcp_payload(
+        [
+            {
+                "title": "Vision news",
+                "link": "https://example.com/vision",
+                "snippet": "summary",
+                "date": datetime.now().strftime("%Y-%m-%d"),
+            }
+        ]
+    )
+
+    def fake_post(url, json=None, headers=None, timeout=None):
+        return FakeResp(payload)
+
+    monkeypatch.setattr(st, "aiohttp", None)
+    tool = MetaSotaSearchTool(api_key="test-api-key", max_articles=3)
+    tool.session = types.SimpleNamespace(get=_fake_get, post=fake_post)
+
+    articles = await tool.search_async("computer vision", days_back=7)
+
+    assert [a.url for a in articles] == ["https://example.com/vision"]
+    assert [a.url for a in tool.search("computer vision", days_back=7)] == [
+        "https://example.com/vision"
+    ]
+
+
+def test_metasota_search_many_batches_queries():
+    """多个查询合并为一次 JSON-RPC 批量 POST，并按 id 拆分响应"""
+    posts = []
+
+    def fake_post(url, json=None, headers=None, timeout=None):
+        posts.append(json)
+        # 批量响应故意倒序返回
+        return FakeResp(
+            [
+                _mcp_payload(
+                    [
+                        {
+                            "title": item["params"]["arguments"]["q"],
+                            "link": f"https://example.com/{item['id']}",
+                        }
+                    ],
+                    request_id=item["id"],
+                )
+                for item in reversed(json)
+            ]
+        )
+
+    tool = MetaSotaSearchTool(api_key="test-api-key", max_articles=3)
+    tool.session = types.SimpleNamespace(get=_fake_get, post=fake_post)
+
+    results = tool.search_many(["vision", "robotics"], days_back=7)
+
+    assert len(posts) == 1
+    assert [[a.title for a in articles] for articles in results] == [["vision"], ["robotics"]]
+
+
+def test_metasota_response_skips_out_of_range_results():
+    """超出时间范围的结果被跳过，无日期或日期无法解析的结果以本次搜索时间保留"""
+    today = datetime.now().strftime("%Y-%m-%d")
+    old = (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
+    data = _mcp_payload(
+        [
+            {"title": "old", "link": "https://example.com/old", "date": old},
+            {"title": "recent", "link": "https://example.com/recent", "date": today},
+            {"title": "undated", "link": "https://example.com/undated"},
+            {"title": "bad", "link": "https://example.com/bad", "date": "not-a-date"},
+        ]
+    )
+
+    tool = MetaSotaSearchTool(api_key="test-api-key", max_articles=10)
+
+    articles = tool._articles_from_mcp_response(data, days_back=7)
+    assert [a.title for a in articles] == ["recent", "undated", "bad"]
+
+    tool.max_articles = 1
+    assert [a.title for a in tool._articles_from_mcp_response(data, days_back=7)] == ["recent"]
+
+
+def test_metasota_extract_published_time_tries_later_fields():
+    """过期或格式错误的首个日期字段不会阻止尝试后续字段，未来日期照常保留"""
+    tool = MetaSotaSearchTool(api_key="test-api-key")
+    now_iso = datetime.now().isoformat()
+    min_date = (datetime.now() - timedelta(days=8)).strftime("%Y-%m-%d")
+    today = datetime.now().strftime("%Y-%m-%d")
+    old = (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
+    future = (datetime.now() + timedelta(days=10)).strftime("%Y-%m-%d")
+
+    def extract(**fields):
+        return tool._extract_published_time(fields, now_iso, min_date)
+
+    assert extract(published_date=old, date=today).startswith(today)
+    assert extract(published_date="2025-99-99", date=today).startswith(today)
+    assert extract(published_date=old) is None
+    assert extract(date=future).startswith(future)
+    assert extract(date="not-a-date") == now_iso
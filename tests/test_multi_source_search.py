@@ -0,0 +1,43 @@
+import time
+
+from ai_news_collector_lib.tools import BaseSearchTool, MultiSourceSearch
+
+from helpers import make_article
+
+
+class SlowTool(BaseSearchTool):
+    def __init__(self, title: str, delay: float = 0.0, error: Exception = None):
+        super().__init__(max_articles=1)
+        self.name = title
+        self.title = title
+        self.delay = delay
+        self.error = error
+
+    def search(self, query, days_back=7):
+        time.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return [make_article(self.title)]
+
+
+def test_multi_source_search_runs_tools_concurrently():
+    tools = [SlowTool(f"tool{i}", delay=0.2) for i in range(4)]
+
+    start = time.monotonic()
+    articles = MultiSourceSearch(tools).search("ai")
+    elapsed = time.monotonic() - start
+
+    assert [a.title for a in articles] == ["tool0", "tool1", "tool2", "tool3"]
+    assert elapsed < 0.6
+
+
+def test_multi_source_search_isolates_failures_and_timeouts():
+    tools = [
+        SlowTool("slow", delay=1.0),
+        SlowTool("broken", error=RuntimeError("boom")),
+        SlowTool("fast"),
+    ]
+
+    results = MultiSourceSearch(tools, timeout=0.3).search_by_tool("ai")
+
+    assert list(results) == ["fast"]
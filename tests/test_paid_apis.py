@@ -24,32 +24,10 @@
 
 import os
 import pytest
-from datetime import datetime
 
+from ai_news_collector_lib.tools.search_tools import _iso_to_ts
 
-def should_test_paid_apis() -> bool:
-    """
-    检查是否应该测试付费API。
-    如果存在对应的cassette文件，即使没有设置环境变量也可以测试。
-    """
-    test_paid = os.getenv("TEST_PAID_APIS", "0") == "1"
-    cassette_dir = os.path.join(os.path.dirname(__file__), "cassettes")
-
-    # 检查是否存在任何付费API的cassette
-    paid_cassettes = [
-        "tavily_search.yaml",
-        "google_search.yaml",
-        "serper_search.yaml",
-        "brave_search.yaml",
-        "metasota_search.yaml",
-        "newsapi_search.yaml",
-    ]
-
-    has_cassettes = any(
-        os.path.exists(os.path.join(cassette_dir, c)) for c in paid_cassettes
-    )
-
-    return test_paid or has_cassettes
+from helpers import should_test_paid_apis
 
 
 # 如果没有配置付费API测试且没有cassettes，跳过所有测试
@@ -61,15 +39,13 @@ pytestmark = pytest.mark.skipif(
 
 @pytest.mark.asyncio
 @pytest.mark.paid_api
-async def test_tavily_search(vcr_vcr):
+async def test_tavily_search(vcr_vcr, cassette_set):
     """测试 Tavily API 搜索"""
     from ai_news_collector_lib.tools.search_tools import TavilyTool
 
     # 检查API密钥
     api_key = os.getenv("TAVILY_API_KEY")
-    if not api_key and not os.path.exists(
-        os.path.join(os.path.dirname(__file__), "cassettes", "tavily_search.yaml")
-    ):
+    if not api_key and "tavily_search.yaml" not in cassette_set:
         pytest.skip("TAVILY_API_KEY 未配置且无cassette")
 
     # 使用实际密钥或占位符（cassette会自动过滤）
@@ -89,21 +65,21 @@ async def test_tavily_search(vcr_vcr):
         assert article.source_name
         assert article.source_name in ["www.coursera.org", "en.wikipedia.org", "cloud.google.com"]
         # 验证日期格式
-        datetime.fromisoformat(article.published.replace("Z", "+00:00"))
+        _iso_to_ts(article.published)
 
 
 @pytest.mark.asyncio
 @pytest.mark.paid_api
-async def test_google_search(vcr_vcr):
+async def test_google_search(vcr_vcr, cassette_set):
     """测试 Google Custom Search API"""
     from ai_news_collector_lib.tools.search_tools import GoogleSearchTool
 
     # 检查API密钥
     api_key = os.getenv("GOOGLE_SEARCH_API_KEY")
     search_engine_id = os.getenv("GOOGLE_SEARCH_ENGINE_ID")
-    if (not api_key or not search_engine_id) and not os.path.exists(
-        os.path.join(os.path.dirname(__file__), "cassettes", "google_search.yaml")
-    ):
+    if (
+        not api_key or not search_engine_id
+    ) and "google_search.yaml" not in cassette_set:
         pytest.skip("Google API 凭证未配置且无cassette") 
 
     tool = GoogleSearchTool(
@@ -124,19 +100,17 @@ async def test_google_search(vcr_vcr):
         # Google API返回的source_name是displayLink（域名）
         assert article.source_name
         assert article.source_name in ["www.nature.com", "www.sciencedaily.com", "www.example.com"]
-        datetime.fromisoformat(article.published.replace("Z", "+00:00"))
+        _iso_to_ts(article.published)
 
 
 @pytest.mark.asyncio
 @pytest.mark.paid_api
-async def test_serper_search(vcr_vcr):
+async def test_serper_search(vcr_vcr, cassette_set):
     """测试 Serper API 搜索"""
     from ai_news_collector_lib.tools.search_tools import SerperTool
 
     api_key = os.getenv("SERPER_API_KEY")
-    if not api_key and not os.path.exists(
-        os.path.join(os.path.dirname(__file__), "cassettes", "serper_search.yaml")
-    ):
+    if not api_key and "serper_search.yaml" not in cassette_set:
         pytest.skip("SERPER_API_KEY 未配置且无cassette")
 
     tool = SerperTool(api_key=api_key or "test-api-key", max_articles=3)
@@ -153,19 +127,17 @@ async def test_serper_search(vcr_vcr):
         # Serper API返回的source_name是从URL提取的域名
         assert article.source_name
         assert article.source_name in ["en.wikipedia.org", "www.deeplearning.ai", "www.ibm.com"]
-        datetime.fromisoformat(article.published.replace("Z", "+00:00"))
+        _iso_to_ts(article.published)
 
 
 @pytest.mark.asyncio
 @pytest.mark.paid_api
-async def test_brave_search(vcr_vcr):
+async def test_brave_search(vcr_vcr, cassette_set):
     """测试 Brave Search API"""
     from ai_news_collector_lib.tools.search_tools import BraveSearchTool
 
     api_key = os.getenv("BRAVE_SEARCH_API_KEY")
-    if not api_key and not os.path.exists(
-        os.path.join(os.path.dirname(__file__), "cassettes", "brave_search.yaml")
-    ):
+    if not api_key and "brave_search.yaml" not in cassette_set:
         pytest.skip("BRAVE_SEARCH_API_KEY 未配置且无cassette")
 
     tool = BraveSearchTool(api_key=api_key or "test-api-key", max_articles=3)
@@ -182,17 +154,15 @@ async def test_brave_search(vcr_vcr):
             # Brave API返回的source_name是从URL提取的域名
             assert article.source_name
             assert article.source_name in ["en.wikipedia.org", "www.example.com", "github.com"]
-            datetime.fromisoformat(article.published.replace("Z", "+00:00"))
+            _iso_to_ts(article.published)
 @pytest.mark.asyncio
 @pytest.mark.paid_api
-async def test_metasota_search(vcr_vcr):
+async def test_metasota_search(vcr_vcr, cassette_set):
     """测试 MetaSota API 搜索"""
     from ai_news_collector_lib.tools.search_tools import MetaSotaSearchTool
 
     api_key = os.getenv("METASOSEARCH_API_KEY")
-    if not api_key and not os.path.exists(
-        os.path.join(os.path.dirname(__file__), "cassettes", "metasota_search.yaml")
-    ):
+    if not api_key and "metasota_search.yaml" not in cassette_set:
         pytest.skip("METASOSEARCH_API_KEY 未配置且无cassette")
 
     tool = MetaSotaSearchTool(api_key=api_key or "test-api-key", max_articles=3)
@@ -208,19 +178,17 @@ async def test_metasota_search(vcr_vcr):
         assert article.source == "metasota_search"
         # MetaSota API返回的source_name就是source字段值（'MetaSota'）
         assert article.source_name == "MetaSota"
-        datetime.fromisoformat(article.published.replace("Z", "+00:00"))
+        _iso_to_ts(article.published)
 
 
 @pytest.mark.asyncio
 @pytest.mark.paid_api
-async def test_newsapi_search(vcr_vcr):
+async def test_newsapi_search(vcr_vcr, cassette_set):
     """测试 NewsAPI 搜索"""
     from ai_news_collector_lib.tools.search_tools import NewsAPITool
 
     api_key = os.getenv("NEWS_API_KEY")
-    if not api_key and not os.path.exists(
-        os.path.join(os.path.dirname(__file__), "cassettes", "newsapi_search.yaml")
-    ):
+    if not api_key and "newsapi_search.yaml" not in cassette_set:
         pytest.skip("NEWS_API_KEY 未配置且无cassette")
 
     tool = NewsAPITool(api_key=api_key or "test-api-key", max_articles=3)
@@ -237,12 +205,12 @@ async def test_newsapi_search(vcr_vcr):
         # NewsAPI返回的source_name是实际的新闻源名称，如"TheStreet"、"CNN"等
         assert article.source_name
         assert len(article.source_name) > 0  # 任何非空字符串都可以
-        datetime.fromisoformat(article.published.replace("Z", "+00:00"))
+        _iso_to_ts(article.published)
 
 
 @pytest.mark.asyncio
 @pytest.mark.paid_api
-async def test_paid_apis_integration(vcr_vcr, allow_network):
+async def test_paid_apis_integration(vcr_vcr, allow_network, cassette_set):
     """
     集成测试：使用所有配置的付费API工具进行搜索
     这个测试会自动检测哪些API已配置，只测试已配置的
@@ -260,11 +228,7 @@ async def test_paid_apis_integration(vcr_vcr, allow_network):
     has_newsapi = bool(os.getenv("NEWS_API_KEY"))
 
     # 如果没有配置任何付费API，检查是否有cassette
-    cassette_exists = os.path.exists(
-        os.path.join(
-            os.path.dirname(__file__), "cassettes", "paid_apis_integration.yaml"
-        )
-    )
+    cassette_exists = "paid_apis_integration.yaml" in cassette_set
 
     if not any([
         has_tavily, has_google, has_serper,
@@ -66,27 +66,25 @@ def upload_to_pypi():
         child_env = os.environ.copy()
         child_env.setdefault('PYTHONIOENCODING', 'utf-8')
         child_env.setdefault('PYTHONUTF8', '1')
-        result = subprocess.run(
+        # 合并stderr并逐行转发twine输出，上传进度实时可见，也无需在内存中缓存完整日志
+        with subprocess.Popen(
             cmd,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
             encoding='utf-8',
             errors='replace',
             env=child_env
-        )
+        ) as proc:
+            for line in proc.stdout:
+                print(line, end='', flush=True)
+            returncode = proc.wait()
         
-        print("STDOUT:")
-        print(result.stdout)
-        
-        if result.stderr:
-            print("STDERR:")
-            print(result.stderr)
-        
-        if result.returncode == 0:
+        if returncode == 0:
             print("✅ 上传成功!")
             return True
         else:
-            print(f"❌ 上传失败，返回码: {result.returncode}")
+            print(f"❌ 上传失败，返回码: {returncode}")
             return False
             
     except Exception as e: